@@ -7,7 +7,7 @@ Provides endpoints for monitoring positions and triggering sells.
 from typing import Any
 
 import structlog
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException
 
 from services.monitor.service import MonitorService, get_monitor_service
 from shared.config import get_settings
@@ -54,12 +54,13 @@ async def health_check() -> HealthResponse:
 
 
 @app.get("/positions/{mode}", tags=["Positions"])
-async def get_positions(mode: TradingMode) -> list[dict[str, Any]]:
+async def get_positions(
+    mode: TradingMode,
+    service: MonitorService = Depends(get_service),
+) -> list[dict[str, Any]]:
     """
     Get open positions for a trading mode.
     """
-    service = get_service()
-
     try:
         positions = await service.get_positions(mode)
         positions = await service.update_position_prices(positions)
@@ -70,12 +71,13 @@ async def get_positions(mode: TradingMode) -> list[dict[str, Any]]:
 
 
 @app.get("/positions/{mode}/summary", tags=["Positions"])
-async def get_positions_summary(mode: TradingMode) -> dict[str, Any]:
+async def get_positions_summary(
+    mode: TradingMode,
+    service: MonitorService = Depends(get_service),
+) -> dict[str, Any]:
     """
     Get summary of current positions.
     """
-    service = get_service()
-
     try:
         return await service.get_positions_summary(mode)
     except Exception as e:
@@ -89,15 +91,16 @@ async def get_positions_summary(mode: TradingMode) -> dict[str, Any]:
 
 
 @app.post("/monitor/{mode}", tags=["Monitoring"])
-async def monitor_positions(mode: TradingMode) -> dict[str, Any]:
+async def monitor_positions(
+    mode: TradingMode,
+    service: MonitorService = Depends(get_service),
+) -> dict[str, Any]:
     """
     Monitor all positions and trigger sells as needed.
 
     Checks each position against stop-loss and take-profit thresholds,
     executing sell orders when triggered.
     """
-    service = get_service()
-
     try:
         results = await service.monitor_positions(mode)
         return results
@@ -107,12 +110,13 @@ async def monitor_positions(mode: TradingMode) -> dict[str, Any]:
 
 
 @app.post("/check-position", tags=["Monitoring"])
-async def check_position(position: dict[str, Any]) -> dict[str, Any]:
+async def check_position(
+    position: dict[str, Any],
+    service: MonitorService = Depends(get_service),
+) -> dict[str, Any]:
     """
     Check if a single position should be sold.
     """
-    service = get_service()
-
     try:
         pos = Position(**position)
         should_sell, action, reason = await service.check_position(pos)
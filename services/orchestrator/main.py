@@ -9,7 +9,7 @@ import asyncio
 from typing import Any
 
 import structlog
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import Depends, FastAPI, HTTPException, Query
 from pydantic import BaseModel, Field
 
 from services.orchestrator.service import OrchestratorService, get_orchestrator_service
@@ -84,14 +84,14 @@ async def readiness_check() -> dict[str, str]:
 
 
 @app.get("/status", tags=["Health"])
-async def system_status() -> dict[str, Any]:
+async def system_status(
+    service: OrchestratorService = Depends(get_service),
+) -> dict[str, Any]:
     """
     Get overall system status.
 
     Returns system configuration, balances, and position summary.
     """
-    service = get_service()
-
     try:
         # Set timeout to 30 seconds for status check
         return await asyncio.wait_for(
@@ -115,7 +115,10 @@ async def system_status() -> dict[str, Any]:
 
 
 @app.post("/workflow/discover", response_model=WorkflowRunResult, tags=["Workflows"])
-async def trigger_discovery(request: WorkflowTriggerRequest) -> WorkflowRunResult:
+async def trigger_discovery(
+    request: WorkflowTriggerRequest,
+    service: OrchestratorService = Depends(get_service),
+) -> WorkflowRunResult:
     """
     Trigger the market discovery and betting workflow.
 
@@ -126,8 +129,6 @@ async def trigger_discovery(request: WorkflowTriggerRequest) -> WorkflowRunResul
 
     Note: This is a long-running operation. Timeout is set to 240 seconds.
     """
-    service = get_service()
-
     try:
         # Set timeout to 240 seconds for workflow execution
         timeout_seconds = 240.0
@@ -149,7 +150,10 @@ async def trigger_discovery(request: WorkflowTriggerRequest) -> WorkflowRunResul
 
 
 @app.post("/workflow/monitor", response_model=WorkflowRunResult, tags=["Workflows"])
-async def trigger_monitor(request: WorkflowTriggerRequest) -> WorkflowRunResult:
+async def trigger_monitor(
+    request: WorkflowTriggerRequest,
+    service: OrchestratorService = Depends(get_service),
+) -> WorkflowRunResult:
     """
     Trigger the position monitoring workflow.
 
@@ -158,8 +162,6 @@ async def trigger_monitor(request: WorkflowTriggerRequest) -> WorkflowRunResult:
     3. Checks against stop-loss/take-profit thresholds
     4. Executes sell orders as needed
     """
-    service = get_service()
-
     try:
         result = await service.run_monitor(request.mode)
         return result
@@ -169,12 +171,13 @@ async def trigger_monitor(request: WorkflowTriggerRequest) -> WorkflowRunResult:
 
 
 @app.post("/workflow/toggle", tags=["Workflows"])
-async def toggle_workflow(request: ToggleWorkflowRequest) -> dict[str, Any]:
+async def toggle_workflow(
+    request: ToggleWorkflowRequest,
+    service: OrchestratorService = Depends(get_service),
+) -> dict[str, Any]:
     """
     Enable or disable a workflow.
     """
-    service = get_service()
-
     try:
         state = await service.toggle_workflow(
             workflow_id=request.workflow_id,
@@ -196,12 +199,11 @@ async def toggle_workflow(request: ToggleWorkflowRequest) -> dict[str, Any]:
 async def get_workflow_state(
     workflow_id: str,
     mode: TradingMode = Query(..., description="Trading mode"),
+    service: OrchestratorService = Depends(get_service),
 ) -> dict[str, Any]:
     """
     Get current state of a workflow.
     """
-    service = get_service()
-
     try:
         state = await service.get_workflow_state(workflow_id, mode)
         if state is None:
@@ -221,6 +223,7 @@ async def get_workflow_state(
 async def get_markets(
     limit: int = Query(default=50, le=100, ge=1),
     filtered: bool = Query(default=True, description="Apply default filters"),
+    service: OrchestratorService = Depends(get_service),
 ) -> list[dict[str, Any]]:
     """
     Get available markets.
@@ -228,8 +231,6 @@ async def get_markets(
     Note: This operation may take time as it fetches and filters markets from Polymarket.
     Timeout is set to 240 seconds to allow for slow API responses.
     """
-    service = get_service()
-
     try:
         # Set timeout to 240 seconds (4 minutes) - Cloud Run default is 300s
         # This gives us time to complete but ensures we return before Cloud Run times out
@@ -261,12 +262,13 @@ async def get_markets(
 
 
 @app.get("/positions/{mode}", tags=["Positions"])
-async def get_positions(mode: TradingMode) -> list[dict[str, Any]]:
+async def get_positions(
+    mode: TradingMode,
+    service: OrchestratorService = Depends(get_service),
+) -> list[dict[str, Any]]:
     """
     Get open positions for a trading mode.
     """
-    service = get_service()
-
     try:
         # Set timeout to 60 seconds for position fetching
         return await asyncio.wait_for(
@@ -290,12 +292,13 @@ async def get_positions(mode: TradingMode) -> list[dict[str, Any]]:
 
 
 @app.get("/balance/{mode}", response_model=BalanceResponse, tags=["Balance"])
-async def get_balance(mode: TradingMode) -> BalanceResponse:
+async def get_balance(
+    mode: TradingMode,
+    service: OrchestratorService = Depends(get_service),
+) -> BalanceResponse:
     """
     Get current balance for trading mode.
     """
-    service = get_service()
-
     try:
         balance = await service.get_balance(mode)
         return BalanceResponse(
@@ -7,7 +7,7 @@ Provides endpoints for executing trades.
 from typing import Any
 
 import structlog
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import Depends, FastAPI, HTTPException, Query
 from pydantic import BaseModel, Field
 
 from services.trader.service import TraderService, get_trader_service
@@ -91,12 +91,13 @@ async def health_check() -> HealthResponse:
 
 
 @app.get("/balance/{mode}", response_model=BalanceResponse, tags=["Balance"])
-async def get_balance(mode: TradingMode) -> BalanceResponse:
+async def get_balance(
+    mode: TradingMode,
+    service: TraderService = Depends(get_service),
+) -> BalanceResponse:
     """
     Get current balance for trading mode.
     """
-    service = get_service()
-
     try:
         balance = await service.get_balance(mode)
         min_balance = settings.trading.min_balance_to_trade
@@ -115,12 +116,11 @@ async def get_balance(mode: TradingMode) -> BalanceResponse:
 async def can_trade(
     mode: TradingMode = Query(..., description="Trading mode"),
     amount: float = Query(..., gt=0, description="Amount to trade"),
+    service: TraderService = Depends(get_service),
 ) -> dict[str, Any]:
     """
     Check if trading is possible for given amount.
     """
-    service = get_service()
-
     try:
         can_trade, reason = await service.can_trade(mode, amount)
         return {
@@ -140,12 +140,13 @@ async def can_trade(
 
 
 @app.post("/orders/buy", response_model=Order, tags=["Orders"])
-async def place_buy_order(request: BuyOrderRequest) -> Order:
+async def place_buy_order(
+    request: BuyOrderRequest,
+    service: TraderService = Depends(get_service),
+) -> Order:
     """
     Place a buy order.
     """
-    service = get_service()
-
     try:
         # Check if we can trade
         can_trade, reason = await service.can_trade(request.mode, request.amount)
@@ -170,12 +171,13 @@ async def place_buy_order(request: BuyOrderRequest) -> Order:
 
 
 @app.post("/orders/sell", response_model=Order, tags=["Orders"])
-async def place_sell_order(request: SellOrderRequest) -> Order:
+async def place_sell_order(
+    request: SellOrderRequest,
+    service: TraderService = Depends(get_service),
+) -> Order:
     """
     Place a sell order to close a position.
     """
-    service = get_service()
-
     try:
         position = Position(**request.position)
         order = await service.place_sell_order(position, request.price)
@@ -187,12 +189,13 @@ async def place_sell_order(request: SellOrderRequest) -> Order:
 
 
 @app.post("/orders/execute-suggestion", response_model=Order, tags=["Orders"])
-async def execute_suggestion(request: ExecuteSuggestionRequest) -> Order:
+async def execute_suggestion(
+    request: ExecuteSuggestionRequest,
+    service: TraderService = Depends(get_service),
+) -> Order:
     """
     Execute a trade based on AI suggestion.
     """
-    service = get_service()
-
     try:
         from shared.models import AISuggestion
 
@@ -3,6 +3,7 @@ Shared pytest fixtures and test configuration for MoneyMaker.
 """
 
 import json
+import logging
 import os
 from collections.abc import Generator
 from datetime import datetime, timedelta
@@ -27,6 +28,23 @@ fake = Faker()
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
+# Loggers that chatter during request handling; formatting their records adds
+# measurable overhead across the suite and the output is never asserted on.
+_NOISY_LOGGERS = (
+    "httpx",
+    "httpcore",
+    "asyncio",
+    "fastapi",
+    "services",
+    "shared",
+)
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Disable noisy loggers before tests run."""
+    for name in _NOISY_LOGGERS:
+        logging.getLogger(name).disabled = True
+
 
 # ============================================================================
 # Fixture Loading Helpers
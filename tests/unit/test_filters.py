@@ -2,43 +2,93 @@
 Unit tests for market filtering logic.
 """
 
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from unittest.mock import MagicMock
 
 import pytest
 
 from services.scraper.filters import FilterResult, MarketFilter
 from shared.models import Market, MarketOutcome
 
-
-@pytest.fixture
+# Single-field overrides that should each reject an otherwise valid market.
+# end_date overrides are expressed as offsets from the shared `now` fixture.
+REJECTION_CASES = [
+    ("already-ended", {"end_date": timedelta(hours=-1)}, "already ended"),
+    ("too-far-future", {"end_date": timedelta(hours=5)}, "exceeds maximum"),
+    ("resolves-too-soon", {"end_date": timedelta(minutes=2)}, "too soon"),
+    ("low-volume", {"volume": 500}, "Volume"),
+    ("low-liquidity", {"liquidity": 200}, "Liquidity"),
+    ("excluded-category", {"category": "sports"}, "excluded"),
+    (
+        "extreme-prices",
+        {
+            "outcomes": [
+                MarketOutcome(name="Yes", price=0.99),
+                MarketOutcome(name="No", price=0.01),
+            ]
+        },
+        "extreme",
+    ),
+]
+
+
+@dataclass(frozen=True)
+class _MarketFiltersConfig:
+    """Plain settings stand-in with direct attribute access."""
+
+    min_volume: int = 1000
+    max_time_to_resolution_hours: float = 1.0
+    min_liquidity: int = 500
+    excluded_categories: tuple[str, ...] = ("sports", "entertainment")
+    min_price: float = 0.05
+    max_price: float = 0.95
+
+
+@dataclass(frozen=True)
+class _FilterSettings:
+    market_filters: _MarketFiltersConfig = field(default_factory=_MarketFiltersConfig)
+
+
+@pytest.fixture(scope="module")
 def mock_settings():
-    """Create mock settings for filter tests."""
-    settings = MagicMock()
-    settings.market_filters = MagicMock()
-    settings.market_filters.min_volume = 1000
-    settings.market_filters.max_time_to_resolution_hours = 1.0
-    settings.market_filters.min_liquidity = 500
-    settings.market_filters.excluded_categories = ["sports", "entertainment"]
-    settings.market_filters.min_price = 0.05
-    settings.market_filters.max_price = 0.95
-    return settings
-
-
-@pytest.fixture
+    """Create lightweight settings for filter tests."""
+    return _FilterSettings()
+
+
+@pytest.fixture(scope="module")
 def market_filter(mock_settings):
     """Create a MarketFilter instance."""
     return MarketFilter(settings=mock_settings)
 
 
-@pytest.fixture
-def valid_market():
+@pytest.fixture(scope="module")
+def now():
+    """Single reference time shared by all filter tests."""
+    return datetime.utcnow()
+
+
+@pytest.fixture(scope="module")
+def base_market_kwargs(now):
+    """Baseline kwargs for a market that passes all filters."""
+    return {
+        "id": "base-market",
+        "question": "Will BTC reach $100k?",
+        "category": "crypto",
+        "end_date": now + timedelta(minutes=30),
+        "volume": 5000,
+        "liquidity": 2500,
+        "outcomes": [MarketOutcome(name="Yes", price=0.50)],
+    }
+
+
+@pytest.fixture(scope="module")
+def valid_market(now):
     """Create a market that passes all filters."""
     return Market(
         id="valid-market",
         question="Will BTC reach $100k?",
         category="crypto",
-        end_date=datetime.utcnow() + timedelta(minutes=30),
+        end_date=now + timedelta(minutes=30),
         volume=5000,
         liquidity=2500,
         outcomes=[
@@ -48,6 +98,21 @@ def valid_market():
     )
 
 
+@pytest.fixture(scope="module")
+def filter_results(market_filter, valid_market, now):
+    """Run filter_markets once over a valid/invalid pair; shared by two tests."""
+    invalid_market = Market(
+        id="invalid-market",
+        question="Invalid",
+        category="sports",
+        end_date=now + timedelta(minutes=30),
+        volume=5000,
+        liquidity=2500,
+        outcomes=[MarketOutcome(name="Yes", price=0.50)],
+    )
+    return market_filter.filter_markets([valid_market, invalid_market])
+
+
 class TestMarketFilter:
     """Tests for MarketFilter class."""
 
@@ -58,155 +123,29 @@ class TestMarketFilter:
         assert result.passed is True
         assert result.market.passes_filter is True
 
-    def test_filter_market_already_ended(self, market_filter):
-        """Test market that has already ended."""
-        market = Market(
-            id="ended-market",
-            question="Past event",
-            end_date=datetime.utcnow() - timedelta(hours=1),
-            volume=5000,
-            liquidity=2500,
-            outcomes=[MarketOutcome(name="Yes", price=0.50)],
-        )
+    def test_filter_market_rejections(self, market_filter, base_market_kwargs, now):
+        """Test that a single failing field rejects an otherwise valid market."""
+        for case_id, override, expected_reason in REJECTION_CASES:
+            if isinstance(override.get("end_date"), timedelta):
+                override = {**override, "end_date": now + override["end_date"]}
+            market = Market(**{**base_market_kwargs, **override})
 
-        result = market_filter.filter_market(market)
+            result = market_filter.filter_market(market)
 
-        assert result.passed is False
-        assert "already ended" in result.reason
-
-    def test_filter_market_too_far_future(self, market_filter):
-        """Test market that resolves too far in future."""
-        market = Market(
-            id="future-market",
-            question="Far future event",
-            end_date=datetime.utcnow() + timedelta(hours=5),
-            volume=5000,
-            liquidity=2500,
-            outcomes=[MarketOutcome(name="Yes", price=0.50)],
-        )
-
-        result = market_filter.filter_market(market)
-
-        assert result.passed is False
-        assert "exceeds maximum" in result.reason
-
-    def test_filter_market_resolves_too_soon(self, market_filter):
-        """Test market that resolves too soon (< 5 minutes)."""
-        market = Market(
-            id="soon-market",
-            question="Imminent event",
-            end_date=datetime.utcnow() + timedelta(minutes=2),
-            volume=5000,
-            liquidity=2500,
-            outcomes=[MarketOutcome(name="Yes", price=0.50)],
-        )
+            assert result.passed is False, case_id
+            assert expected_reason in result.reason, case_id
 
-        result = market_filter.filter_market(market)
-
-        assert result.passed is False
-        assert "too soon" in result.reason
-
-    def test_filter_market_low_volume(self, market_filter):
-        """Test market with insufficient volume."""
-        market = Market(
-            id="low-volume-market",
-            question="Low volume event",
-            end_date=datetime.utcnow() + timedelta(minutes=30),
-            volume=500,  # Below 1000 minimum
-            liquidity=2500,
-            outcomes=[MarketOutcome(name="Yes", price=0.50)],
-        )
-
-        result = market_filter.filter_market(market)
-
-        assert result.passed is False
-        assert "Volume" in result.reason
-
-    def test_filter_market_low_liquidity(self, market_filter):
-        """Test market with insufficient liquidity."""
-        market = Market(
-            id="low-liquidity-market",
-            question="Low liquidity event",
-            end_date=datetime.utcnow() + timedelta(minutes=30),
-            volume=5000,
-            liquidity=200,  # Below 500 minimum
-            outcomes=[MarketOutcome(name="Yes", price=0.50)],
-        )
-
-        result = market_filter.filter_market(market)
-
-        assert result.passed is False
-        assert "Liquidity" in result.reason
-
-    def test_filter_market_excluded_category(self, market_filter):
-        """Test market with excluded category."""
-        market = Market(
-            id="sports-market",
-            question="Sports event",
-            category="sports",
-            end_date=datetime.utcnow() + timedelta(minutes=30),
-            volume=5000,
-            liquidity=2500,
-            outcomes=[MarketOutcome(name="Yes", price=0.50)],
-        )
-
-        result = market_filter.filter_market(market)
-
-        assert result.passed is False
-        assert "excluded" in result.reason
-
-    def test_filter_market_extreme_prices(self, market_filter):
-        """Test market with extreme outcome prices."""
-        market = Market(
-            id="extreme-price-market",
-            question="Almost certain event",
-            category="crypto",
-            end_date=datetime.utcnow() + timedelta(minutes=30),
-            volume=5000,
-            liquidity=2500,
-            outcomes=[
-                MarketOutcome(name="Yes", price=0.99),  # Too extreme
-                MarketOutcome(name="No", price=0.01),  # Too extreme
-            ],
-        )
-
-        result = market_filter.filter_market(market)
-
-        assert result.passed is False
-        assert "extreme" in result.reason
-
-    def test_filter_markets_multiple(self, market_filter, valid_market):
+    def test_filter_markets_multiple(self, filter_results):
         """Test filtering multiple markets."""
-        invalid_market = Market(
-            id="invalid-market",
-            question="Invalid",
-            category="sports",
-            end_date=datetime.utcnow() + timedelta(minutes=30),
-            volume=5000,
-            liquidity=2500,
-            outcomes=[MarketOutcome(name="Yes", price=0.50)],
-        )
-
-        markets = [valid_market, invalid_market]
-        passing, results = market_filter.filter_markets(markets)
+        passing, results = filter_results
 
         assert len(passing) == 1
         assert passing[0].id == "valid-market"
         assert len(results) == 2
 
-    def test_get_filter_summary(self, market_filter, valid_market):
+    def test_get_filter_summary(self, market_filter, filter_results):
         """Test filter summary generation."""
-        invalid_market = Market(
-            id="invalid-market",
-            question="Invalid",
-            category="sports",
-            end_date=datetime.utcnow() + timedelta(minutes=30),
-            volume=5000,
-            liquidity=2500,
-            outcomes=[MarketOutcome(name="Yes", price=0.50)],
-        )
-
-        _, results = market_filter.filter_markets([valid_market, invalid_market])
+        _, results = filter_results
         summary = market_filter.get_filter_summary(results)
 
         assert summary["total_markets"] == 2
@@ -2,32 +2,60 @@
 Unit tests for position monitor service.
 """
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+from dataclasses import dataclass, field
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from services.monitor.service import MonitorService, get_monitor_service
 from shared.models import Order, OrderStatus, Position, TradingMode
 
+# (pnl_percent, expected_sell, expected_action) threshold matrix
+CHECK_POSITION_CASES = [
+    (-20.0, True, "stop_loss"),  # below stop-loss
+    (-15.0, True, "stop_loss"),  # exactly at stop-loss
+    (-14.4, False, "hold"),  # just above stop-loss
+    (8.57, False, "hold"),  # between thresholds
+    (30.0, True, "take_profit"),  # exactly at take-profit
+    (40.0, True, "take_profit"),  # above take-profit
+]
 
-@pytest.fixture
+
+@dataclass(frozen=True)
+class _SellThresholds:
+    """Plain settings stand-in with direct attribute access."""
+
+    stop_loss_percent: float = -15.0
+    take_profit_percent: float = 30.0
+
+
+@dataclass(frozen=True)
+class _TradingConfig:
+    sell_thresholds: _SellThresholds = field(default_factory=_SellThresholds)
+    max_positions: int = 10
+
+
+@dataclass(frozen=True)
+class _MonitorSettings:
+    trading: _TradingConfig = field(default_factory=_TradingConfig)
+
+
+@pytest.fixture(scope="module")
 def mock_settings():
-    """Create mock settings."""
-    settings = MagicMock()
-    settings.trading = MagicMock()
-    settings.trading.sell_thresholds = MagicMock()
-    settings.trading.sell_thresholds.stop_loss_percent = -15.0
-    settings.trading.sell_thresholds.take_profit_percent = 30.0
-    settings.trading.max_positions = 10
-    return settings
+    """Create lightweight settings for monitor tests."""
+    return _MonitorSettings()
 
 
-@pytest.fixture
-def mock_trader():
-    """Create mock trader service."""
-    trader = MagicMock()
-    trader.place_sell_order = AsyncMock(
-        return_value=Order(
+class _StubTrader:
+    """Minimal async stand-in for TraderService without Mock bookkeeping."""
+
+    def __init__(self):
+        self.sell_calls: list[Position] = []
+
+    async def place_sell_order(self, position: Position) -> Order:
+        self.sell_calls.append(position)
+        return Order(
             id="order-001",
             market_id="market-001",
             outcome="Yes",
@@ -38,16 +66,45 @@ def mock_trader():
             status=OrderStatus.FILLED,
             mode=TradingMode.FAKE,
         )
-    )
-    return trader
 
 
-@pytest.fixture
+class _StubFirestore:
+    """Minimal async stand-in for FirestoreClient."""
+
+    def __init__(self):
+        self.positions: list[Position] = []
+
+    async def get_open_positions(self, mode: TradingMode) -> list[Position]:
+        return list(self.positions)
+
+
+@pytest.fixture(scope="module")
+def mock_trader():
+    """Create stub trader service (shared across the module)."""
+    return _StubTrader()
+
+
+@pytest.fixture(scope="module")
 def mock_firestore():
-    """Create mock Firestore client."""
-    client = MagicMock()
-    client.get_open_positions = AsyncMock(return_value=[])
-    return client
+    """Create stub Firestore client (shared across the module)."""
+    return _StubFirestore()
+
+
+@pytest.fixture(autouse=True)
+def _reset_monitor_stubs(mock_trader, mock_firestore):
+    """Clear stub state so per-test setup doesn't leak."""
+    mock_trader.sell_calls.clear()
+    mock_firestore.positions = []
+
+
+@pytest.fixture(scope="module")
+def monitor_service(mock_settings, mock_trader, mock_firestore):
+    """Create a MonitorService wired to the shared mocks."""
+    return MonitorService(
+        trader_service=mock_trader,
+        firestore_client=mock_firestore,
+        settings=mock_settings,
+    )
 
 
 @pytest.fixture
@@ -84,6 +141,28 @@ def losing_position():
     )
 
 
+@pytest.fixture
+def make_position():
+    """Factory for positions that differ only in P&L."""
+
+    def _make(pnl_percent, **overrides):
+        defaults = {
+            "id": "pos",
+            "market_id": "market-001",
+            "outcome": "Yes",
+            "entry_price": 0.50,
+            "current_price": 0.50,
+            "quantity": 100,
+            "entry_value": 50.0,
+            "current_value": 50.0,
+            "mode": TradingMode.FAKE,
+        }
+        defaults.update(overrides)
+        return Position(pnl_percent=pnl_percent, **defaults)
+
+    return _make
+
+
 @pytest.fixture
 def neutral_position():
     """Create a position that should not trigger any sell."""
@@ -104,193 +183,63 @@ def neutral_position():
 class TestMonitorService:
     """Tests for MonitorService."""
 
-    def test_stop_loss_threshold(self, mock_settings):
+    def test_stop_loss_threshold(self, monitor_service):
         """Test stop-loss threshold property."""
-        service = MonitorService(settings=mock_settings)
+        assert monitor_service.stop_loss_threshold == -15.0
 
-        assert service.stop_loss_threshold == -15.0
-
-    def test_take_profit_threshold(self, mock_settings):
+    def test_take_profit_threshold(self, monitor_service):
         """Test take-profit threshold property."""
-        service = MonitorService(settings=mock_settings)
-
-        assert service.take_profit_threshold == 30.0
-
-    @pytest.mark.asyncio
-    async def test_check_position_stop_loss(self, mock_settings, mock_trader, losing_position):
-        """Test stop-loss trigger."""
-        service = MonitorService(
-            trader_service=mock_trader,
-            settings=mock_settings,
-        )
-
-        should_sell, action, reason = await service.check_position(losing_position)
-
-        assert should_sell is True
-        assert action == "stop_loss"
-        assert "-20.0%" in reason or "-15%" in reason
-
-    @pytest.mark.asyncio
-    async def test_check_position_take_profit(
-        self, mock_settings, mock_trader, profitable_position
-    ):
-        """Test take-profit trigger."""
-        service = MonitorService(
-            trader_service=mock_trader,
-            settings=mock_settings,
-        )
-
-        should_sell, action, reason = await service.check_position(profitable_position)
-
-        assert should_sell is True
-        assert action == "take_profit"
-        assert "40.0%" in reason or "30%" in reason
-
-    @pytest.mark.asyncio
-    async def test_check_position_hold(self, mock_settings, mock_trader, neutral_position):
-        """Test position that should be held."""
-        service = MonitorService(
-            trader_service=mock_trader,
-            settings=mock_settings,
-        )
-
-        should_sell, action, reason = await service.check_position(neutral_position)
-
-        assert should_sell is False
-        assert action == "hold"
-
-    @pytest.mark.asyncio
-    async def test_check_position_exact_stop_loss(self, mock_settings, mock_trader):
-        """Test position at exactly stop-loss threshold."""
-        position = Position(
-            id="pos-exact",
-            market_id="market-001",
-            outcome="Yes",
-            entry_price=0.50,
-            current_price=0.425,
-            quantity=100,
-            entry_value=50.0,
-            current_value=42.5,
-            pnl_percent=-15.0,  # Exactly at threshold
-            mode=TradingMode.FAKE,
-        )
-
-        service = MonitorService(
-            trader_service=mock_trader,
-            settings=mock_settings,
-        )
-
-        should_sell, action, _ = await service.check_position(position)
-
-        assert should_sell is True
-        assert action == "stop_loss"
-
-    @pytest.mark.asyncio
-    async def test_check_position_exact_take_profit(self, mock_settings, mock_trader):
-        """Test position at exactly take-profit threshold."""
-        position = Position(
-            id="pos-exact",
-            market_id="market-001",
-            outcome="Yes",
-            entry_price=0.30,
-            current_price=0.39,
-            quantity=100,
-            entry_value=30.0,
-            current_value=39.0,
-            pnl_percent=30.0,  # Exactly at threshold
-            mode=TradingMode.FAKE,
-        )
-
-        service = MonitorService(
-            trader_service=mock_trader,
-            settings=mock_settings,
-        )
-
-        should_sell, action, _ = await service.check_position(position)
+        assert monitor_service.take_profit_threshold == 30.0
 
-        assert should_sell is True
-        assert action == "take_profit"
+    async def test_check_position_matrix(self, monitor_service, make_position):
+        """Test check_position across the threshold matrix, gathered concurrently."""
+        positions = [make_position(pnl) for pnl, _, _ in CHECK_POSITION_CASES]
 
-    @pytest.mark.asyncio
-    async def test_check_position_just_above_stop_loss(self, mock_settings, mock_trader):
-        """Test position just above stop-loss (should not trigger)."""
-        position = Position(
-            id="pos-close",
-            market_id="market-001",
-            outcome="Yes",
-            entry_price=0.50,
-            current_price=0.428,
-            quantity=100,
-            entry_value=50.0,
-            current_value=42.8,
-            pnl_percent=-14.4,  # Just above -15%
-            mode=TradingMode.FAKE,
-        )
-
-        service = MonitorService(
-            trader_service=mock_trader,
-            settings=mock_settings,
+        results = await asyncio.gather(
+            *(monitor_service.check_position(position) for position in positions)
         )
 
-        should_sell, action, _ = await service.check_position(position)
+        for (pnl, expected_sell, expected_action), (should_sell, action, reason) in zip(
+            CHECK_POSITION_CASES, results, strict=True
+        ):
+            assert should_sell is expected_sell, pnl
+            assert action == expected_action, pnl
+            if expected_sell:
+                assert f"{pnl:.1f}%" in reason, pnl
 
-        assert should_sell is False
-        assert action == "hold"
-
-    @pytest.mark.asyncio
-    async def test_monitor_positions_empty(self, mock_settings, mock_trader, mock_firestore):
+    async def test_monitor_positions_empty(self, monitor_service):
         """Test monitoring with no positions."""
-        service = MonitorService(
-            trader_service=mock_trader,
-            firestore_client=mock_firestore,
-            settings=mock_settings,
-        )
-
-        results = await service.monitor_positions(TradingMode.FAKE)
+        results = await monitor_service.monitor_positions(TradingMode.FAKE)
 
         assert results["positions_checked"] == 0
         assert results["sells_triggered"] == 0
 
-    @pytest.mark.asyncio
     async def test_monitor_positions_triggers_sell(
-        self, mock_settings, mock_trader, mock_firestore, losing_position
+        self, monitor_service, mock_trader, mock_firestore, losing_position
     ):
         """Test monitoring triggers sell for losing position."""
-        mock_firestore.get_open_positions = AsyncMock(return_value=[losing_position])
-
-        service = MonitorService(
-            trader_service=mock_trader,
-            firestore_client=mock_firestore,
-            settings=mock_settings,
-        )
+        mock_firestore.positions = [losing_position]
 
-        results = await service.monitor_positions(TradingMode.FAKE)
+        results = await monitor_service.monitor_positions(TradingMode.FAKE)
 
         assert results["positions_checked"] == 1
         assert results["sells_triggered"] == 1
         assert results["stop_losses"] == 1
-        mock_trader.place_sell_order.assert_called_once()
+        assert len(mock_trader.sell_calls) == 1
 
-    @pytest.mark.asyncio
     async def test_get_positions_summary(
-        self, mock_settings, mock_trader, mock_firestore, neutral_position
+        self, monitor_service, mock_firestore, neutral_position
     ):
         """Test getting positions summary."""
-        mock_firestore.get_open_positions = AsyncMock(return_value=[neutral_position])
-
-        service = MonitorService(
-            trader_service=mock_trader,
-            firestore_client=mock_firestore,
-            settings=mock_settings,
-        )
+        mock_firestore.positions = [neutral_position]
 
-        summary = await service.get_positions_summary(TradingMode.FAKE)
+        summary = await monitor_service.get_positions_summary(TradingMode.FAKE)
 
         assert summary["count"] == 1
         assert summary["profitable"] == 1
         assert summary["losing"] == 0
 
-    def test_should_trigger_alert_near_stop_loss(self, mock_settings):
+    def test_should_trigger_alert_near_stop_loss(self, monitor_service):
         """Test alert trigger near stop-loss."""
         position = Position(
             id="pos-alert",
@@ -305,8 +254,7 @@ class TestMonitorService:
             mode=TradingMode.FAKE,
         )
 
-        service = MonitorService(settings=mock_settings)
-        should_alert, reason = service.should_trigger_alert(position)
+        should_alert, reason = monitor_service.should_trigger_alert(position)
 
         assert should_alert is True
         assert "stop-loss" in reason
@@ -3,40 +3,69 @@ Unit tests for Monitor service FastAPI endpoints.
 """
 
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
 
+import services.monitor.main as monitor_main
+from services.monitor.main import app
 from shared.models import Position, TradingMode
 
+# Run every test on the module-scoped loop shared with the client fixture
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
-@pytest.fixture
+# Deterministic timestamp; avoids a clock read per fixture instantiation
+_FIXED_NOW = datetime(2025, 1, 1)
+
+
+def _restore_default_returns(service):
+    """Point every mocked service method at its default return value."""
+    service.get_positions.return_value = []
+    service.update_position_prices.return_value = []
+    service.get_positions_summary.return_value = {
+        "total_positions": 0,
+        "total_value": 0,
+        "total_pnl": 0,
+    }
+    service.monitor_positions.return_value = {
+        "positions_checked": 0,
+        "sells_triggered": 0,
+    }
+    service.check_position.return_value = (False, "hold", "No action needed")
+
+
+@pytest.fixture(scope="module")
 def mock_monitor_service():
-    """Create a mocked monitor service."""
+    """Create a mocked monitor service (shared across the module)."""
     service = MagicMock()
-    service.get_positions = AsyncMock(return_value=[])
-    service.update_position_prices = AsyncMock(return_value=[])
-    service.get_positions_summary = AsyncMock(
-        return_value={
-            "total_positions": 0,
-            "total_value": 0,
-            "total_pnl": 0,
-        }
-    )
-    service.monitor_positions = AsyncMock(
-        return_value={
-            "positions_checked": 0,
-            "sells_triggered": 0,
-        }
-    )
-    service.check_position = AsyncMock(return_value=(False, "hold", "No action needed"))
+    service.get_positions = AsyncMock()
+    service.update_position_prices = AsyncMock()
+    service.get_positions_summary = AsyncMock()
+    service.monitor_positions = AsyncMock()
+    service.check_position = AsyncMock()
+    _restore_default_returns(service)
     service.stop_loss_threshold = -15.0
     service.take_profit_threshold = 30.0
     return service
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def _reset_monitor_service(mock_monitor_service):
+    """Restore default mock behavior so per-test overrides don't leak."""
+    for method in (
+        mock_monitor_service.get_positions,
+        mock_monitor_service.update_position_prices,
+        mock_monitor_service.get_positions_summary,
+        mock_monitor_service.monitor_positions,
+        mock_monitor_service.check_position,
+    ):
+        method.reset_mock(return_value=True, side_effect=True)
+    _restore_default_returns(mock_monitor_service)
+
+
+@pytest.fixture(scope="module")
 def sample_position():
     """Create a sample position."""
     return Position(
@@ -50,35 +79,33 @@ def sample_position():
         entry_value=30.0,
         current_value=35.0,
         pnl_percent=16.67,
-        created_at=datetime.utcnow(),
+        created_at=_FIXED_NOW,
         mode=TradingMode.FAKE,
     )
 
 
-@pytest.fixture
-def client(mock_monitor_service):
-    """Create test client with mocked service."""
-    with patch("services.monitor.main._monitor_service", None):
-        with patch(
-            "services.monitor.main.get_monitor_service",
-            return_value=mock_monitor_service,
-        ):
-            import services.monitor.main as monitor_main
-            from services.monitor.main import app
+@pytest.fixture(scope="module")
+def sample_position_json(sample_position):
+    """Serialize the sample position once for request payloads."""
+    return sample_position.model_dump(mode="json")
 
-            # Reset service instance
-            monitor_main._monitor_service = None
 
-            with TestClient(app) as test_client:
-                yield test_client
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def client(mock_monitor_service):
+    """Create an in-process async client with the mocked service installed."""
+    app.dependency_overrides[monitor_main.get_service] = lambda: mock_monitor_service
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as async_client:
+        yield async_client
+    app.dependency_overrides.pop(monitor_main.get_service, None)
 
 
 class TestHealthEndpoints:
     """Tests for health check endpoints."""
 
-    def test_health_check(self, client):
+    async def test_health_check(self, client):
         """Test health check endpoint returns healthy status."""
-        response = client.get("/health")
+        response = await client.get("/health")
 
         assert response.status_code == 200
         data = response.json()
@@ -89,68 +116,60 @@ class TestHealthEndpoints:
 class TestPositionEndpoints:
     """Tests for position endpoints."""
 
-    def test_get_positions_fake(self, client, mock_monitor_service, sample_position):
+    async def test_get_positions_fake(self, client, mock_monitor_service, sample_position):
         """Test getting fake mode positions."""
-        mock_monitor_service.get_positions = AsyncMock(return_value=[sample_position])
-        mock_monitor_service.update_position_prices = AsyncMock(
-            return_value=[sample_position]
-        )
+        mock_monitor_service.get_positions.return_value = [sample_position]
+        mock_monitor_service.update_position_prices.return_value = [sample_position]
 
-        response = client.get("/positions/fake")
+        response = await client.get("/positions/fake")
 
         assert response.status_code == 200
         data = response.json()
         assert len(data) == 1
         assert data[0]["id"] == "position-001"
 
-    def test_get_positions_real(self, client, mock_monitor_service, sample_position):
+    async def test_get_positions_real(self, client, mock_monitor_service, sample_position):
         """Test getting real mode positions."""
-        sample_position.mode = TradingMode.REAL
-        mock_monitor_service.get_positions = AsyncMock(return_value=[sample_position])
-        mock_monitor_service.update_position_prices = AsyncMock(
-            return_value=[sample_position]
-        )
+        real_position = sample_position.model_copy(update={"mode": TradingMode.REAL})
+        mock_monitor_service.get_positions.return_value = [real_position]
+        mock_monitor_service.update_position_prices.return_value = [real_position]
 
-        response = client.get("/positions/real")
+        response = await client.get("/positions/real")
 
         assert response.status_code == 200
         data = response.json()
         assert len(data) == 1
 
-    def test_get_positions_empty(self, client, mock_monitor_service):
+    async def test_get_positions_empty(self, client, mock_monitor_service):
         """Test getting positions when none exist."""
-        mock_monitor_service.get_positions = AsyncMock(return_value=[])
-        mock_monitor_service.update_position_prices = AsyncMock(return_value=[])
+        mock_monitor_service.get_positions.return_value = []
+        mock_monitor_service.update_position_prices.return_value = []
 
-        response = client.get("/positions/fake")
+        response = await client.get("/positions/fake")
 
         assert response.status_code == 200
         data = response.json()
         assert len(data) == 0
 
-    def test_get_positions_error(self, client, mock_monitor_service):
+    async def test_get_positions_error(self, client, mock_monitor_service):
         """Test positions error handling."""
-        mock_monitor_service.get_positions = AsyncMock(
-            side_effect=Exception("Database Error")
-        )
+        mock_monitor_service.get_positions.side_effect = Exception("Database Error")
 
-        response = client.get("/positions/fake")
+        response = await client.get("/positions/fake")
 
         assert response.status_code == 500
         assert "Database Error" in response.json()["detail"]
 
-    def test_get_positions_summary(self, client, mock_monitor_service):
+    async def test_get_positions_summary(self, client, mock_monitor_service):
         """Test getting positions summary."""
-        mock_monitor_service.get_positions_summary = AsyncMock(
-            return_value={
-                "total_positions": 5,
-                "total_value": 500.0,
-                "total_pnl": 50.0,
-                "pnl_percent": 10.0,
-            }
-        )
+        mock_monitor_service.get_positions_summary.return_value = {
+            "total_positions": 5,
+            "total_value": 500.0,
+            "total_pnl": 50.0,
+            "pnl_percent": 10.0,
+        }
 
-        response = client.get("/positions/fake/summary")
+        response = await client.get("/positions/fake/summary")
 
         assert response.status_code == 200
         data = response.json()
@@ -158,13 +177,11 @@ class TestPositionEndpoints:
         assert data["total_value"] == 500.0
         assert data["total_pnl"] == 50.0
 
-    def test_get_positions_summary_error(self, client, mock_monitor_service):
+    async def test_get_positions_summary_error(self, client, mock_monitor_service):
         """Test summary error handling."""
-        mock_monitor_service.get_positions_summary = AsyncMock(
-            side_effect=Exception("Summary Error")
-        )
+        mock_monitor_service.get_positions_summary.side_effect = Exception("Summary Error")
 
-        response = client.get("/positions/fake/summary")
+        response = await client.get("/positions/fake/summary")
 
         assert response.status_code == 500
 
@@ -172,115 +189,82 @@ class TestPositionEndpoints:
 class TestMonitoringEndpoints:
     """Tests for monitoring endpoints."""
 
-    def test_monitor_positions_success(self, client, mock_monitor_service):
+    async def test_monitor_positions_success(self, client, mock_monitor_service):
         """Test successful position monitoring."""
-        mock_monitor_service.monitor_positions = AsyncMock(
-            return_value={
-                "positions_checked": 3,
-                "sells_triggered": 1,
-                "actions": [
-                    {"position_id": "pos-001", "action": "take_profit"}
-                ],
-            }
-        )
+        mock_monitor_service.monitor_positions.return_value = {
+            "positions_checked": 3,
+            "sells_triggered": 1,
+            "actions": [{"position_id": "pos-001", "action": "take_profit"}],
+        }
 
-        response = client.post("/monitor/fake")
+        response = await client.post("/monitor/fake")
 
         assert response.status_code == 200
         data = response.json()
         assert data["positions_checked"] == 3
         assert data["sells_triggered"] == 1
 
-    def test_monitor_positions_real(self, client, mock_monitor_service):
+    async def test_monitor_positions_real(self, client, mock_monitor_service):
         """Test monitoring real mode positions."""
-        mock_monitor_service.monitor_positions = AsyncMock(
-            return_value={
-                "positions_checked": 2,
-                "sells_triggered": 0,
-            }
-        )
+        mock_monitor_service.monitor_positions.return_value = {
+            "positions_checked": 2,
+            "sells_triggered": 0,
+        }
 
-        response = client.post("/monitor/real")
+        response = await client.post("/monitor/real")
 
         assert response.status_code == 200
         mock_monitor_service.monitor_positions.assert_called_once()
 
-    def test_monitor_positions_error(self, client, mock_monitor_service):
+    async def test_monitor_positions_error(self, client, mock_monitor_service):
         """Test monitoring error handling."""
-        mock_monitor_service.monitor_positions = AsyncMock(
-            side_effect=Exception("Monitor Error")
-        )
+        mock_monitor_service.monitor_positions.side_effect = Exception("Monitor Error")
 
-        response = client.post("/monitor/fake")
+        response = await client.post("/monitor/fake")
 
         assert response.status_code == 500
 
-    def test_check_position_no_action(
-        self, client, mock_monitor_service, sample_position
-    ):
-        """Test checking position that requires no action."""
-        mock_monitor_service.check_position = AsyncMock(
-            return_value=(False, "hold", "Position within thresholds")
-        )
-
-        response = client.post(
-            "/check-position",
-            json=sample_position.model_dump(mode="json"),
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["should_sell"] is False
-        assert data["action"] == "hold"
-        assert "thresholds" in data
-
-    def test_check_position_take_profit(
-        self, client, mock_monitor_service, sample_position
-    ):
-        """Test checking position that triggers take profit."""
-        sample_position.pnl_percent = 35.0
-        mock_monitor_service.check_position = AsyncMock(
-            return_value=(True, "take_profit", "PnL above threshold")
-        )
-
-        response = client.post(
-            "/check-position",
-            json=sample_position.model_dump(mode="json"),
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["should_sell"] is True
-        assert data["action"] == "take_profit"
-
-    def test_check_position_stop_loss(
-        self, client, mock_monitor_service, sample_position
+    @pytest.mark.parametrize(
+        ("pnl_percent", "service_return", "expect_sell", "expect_action"),
+        [
+            (None, (False, "hold", "Position within thresholds"), False, "hold"),
+            (35.0, (True, "take_profit", "PnL above threshold"), True, "take_profit"),
+            (-20.0, (True, "stop_loss", "PnL below threshold"), True, "stop_loss"),
+        ],
+    )
+    async def test_check_position(
+        self,
+        client,
+        mock_monitor_service,
+        sample_position_json,
+        pnl_percent,
+        service_return,
+        expect_sell,
+        expect_action,
     ):
-        """Test checking position that triggers stop loss."""
-        sample_position.pnl_percent = -20.0
-        mock_monitor_service.check_position = AsyncMock(
-            return_value=(True, "stop_loss", "PnL below threshold")
-        )
+        """Test checking a position across hold/take-profit/stop-loss outcomes."""
+        mock_monitor_service.check_position.return_value = service_return
+        payload = sample_position_json
+        if pnl_percent is not None:
+            payload = {**sample_position_json, "pnl_percent": pnl_percent}
 
-        response = client.post(
+        response = await client.post(
             "/check-position",
-            json=sample_position.model_dump(mode="json"),
+            json=payload,
         )
 
         assert response.status_code == 200
         data = response.json()
-        assert data["should_sell"] is True
-        assert data["action"] == "stop_loss"
+        assert data["should_sell"] is expect_sell
+        assert data["action"] == expect_action
 
-    def test_check_position_error(self, client, mock_monitor_service, sample_position):
+    async def test_check_position_error(self, client, mock_monitor_service, sample_position_json):
         """Test check position error handling."""
-        mock_monitor_service.check_position = AsyncMock(
-            side_effect=Exception("Check Error")
-        )
+        mock_monitor_service.check_position.side_effect = Exception("Check Error")
 
-        response = client.post(
+        response = await client.post(
             "/check-position",
-            json=sample_position.model_dump(mode="json"),
+            json=sample_position_json,
         )
 
         assert response.status_code == 500
@@ -289,9 +273,9 @@ class TestMonitoringEndpoints:
 class TestConfigEndpoints:
     """Tests for configuration endpoints."""
 
-    def test_get_monitor_config(self, client):
+    async def test_get_monitor_config(self, client):
         """Test getting monitor configuration."""
-        response = client.get("/config")
+        response = await client.get("/config")
 
         assert response.status_code == 200
         data = response.json()
@@ -2,6 +2,7 @@
 Unit tests for orchestrator service.
 """
 
+from dataclasses import dataclass, field
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -22,190 +23,263 @@ from shared.models import (
 )
 
 
-@pytest.fixture
+@dataclass(frozen=True)
+class _SellThresholds:
+    """Plain settings stand-ins with direct attribute access."""
+
+    stop_loss_percent: float = -15.0
+    take_profit_percent: float = 30.0
+
+
+@dataclass(frozen=True)
+class _TradingConfig:
+    min_balance_to_trade: float = 10.0
+    max_bet_amount: float = 50.0
+    max_positions: int = 10
+    sell_thresholds: _SellThresholds = field(default_factory=_SellThresholds)
+
+
+@dataclass(frozen=True)
+class _AIConfig:
+    max_suggestions: int = 5
+    confidence_threshold: float = 0.7
+
+
+@dataclass(frozen=True)
+class _OrchestratorSettings:
+    real_money_enabled: bool = False
+    fake_money_enabled: bool = True
+    trading: _TradingConfig = field(default_factory=_TradingConfig)
+    ai: _AIConfig = field(default_factory=_AIConfig)
+
+    def get_active_mode(self) -> str:
+        return "fake"
+
+
+@pytest.fixture(scope="module")
 def mock_settings():
-    """Create mock settings."""
-    settings = MagicMock()
-    settings.real_money_enabled = False
-    settings.fake_money_enabled = True
-    settings.trading = MagicMock()
-    settings.trading.min_balance_to_trade = 10.0
-    settings.trading.max_bet_amount = 50.0
-    settings.trading.max_positions = 10
-    settings.trading.sell_thresholds = MagicMock()
-    settings.trading.sell_thresholds.stop_loss_percent = -15.0
-    settings.trading.sell_thresholds.take_profit_percent = 30.0
-    settings.ai = MagicMock()
-    settings.ai.max_suggestions = 5
-    settings.ai.confidence_threshold = 0.7
-    settings.get_active_mode = MagicMock(return_value="fake")
-    return settings
-
-
-@pytest.fixture
+    """Create lightweight settings for orchestrator tests."""
+    return _OrchestratorSettings()
+
+
+# Deterministic timestamp; avoids a clock read per fixture instantiation
+_FIXED_NOW = datetime(2025, 1, 1)
+
+# Default mock payloads, validated once at import instead of per test. Tests
+# never mutate these instances, so sharing them across tests is safe.
+_SAMPLE_MARKET = Market(
+    id="market-001",
+    question="Test market",
+    end_date=_FIXED_NOW,
+    outcomes=[MarketOutcome(name="Yes", price=0.5)],
+)
+_SAMPLE_ANALYSIS = AIAnalysisResult(
+    suggestions=[
+        AISuggestion(
+            market_id="market-001",
+            recommended_outcome="Yes",
+            confidence=0.85,
+        )
+    ],
+    markets_analyzed=1,
+)
+_SAMPLE_ORDER = Order(
+    id="order-001",
+    market_id="market-001",
+    outcome="Yes",
+    side="buy",
+    price=0.35,
+    quantity=100,
+    total_value=35.0,
+    status=OrderStatus.FILLED,
+)
+_SAMPLE_WORKFLOW_STATE = WorkflowState(
+    workflow_id="discovery",
+    mode=TradingMode.FAKE,
+    enabled=True,
+)
+
+
+def _restore_scraper_returns(scraper):
+    """Point every mocked scraper method at its default return value."""
+    scraper.get_tradeable_markets.return_value = [_SAMPLE_MARKET]
+    scraper.get_filtered_markets.return_value = ([], {})
+    scraper.get_markets.return_value = []
+
+
+@pytest.fixture(scope="module")
 def mock_scraper():
-    """Create mock scraper service."""
+    """Create mock scraper service (shared across the module)."""
     scraper = MagicMock()
-    scraper.get_tradeable_markets = AsyncMock(
-        return_value=[
-            Market(
-                id="market-001",
-                question="Test market",
-                end_date=datetime.utcnow(),
-                outcomes=[MarketOutcome(name="Yes", price=0.5)],
-            )
-        ]
-    )
-    scraper.get_filtered_markets = AsyncMock(return_value=([], {}))
-    scraper.get_markets = AsyncMock(return_value=[])
+    scraper.get_tradeable_markets = AsyncMock()
+    scraper.get_filtered_markets = AsyncMock()
+    scraper.get_markets = AsyncMock()
+    _restore_scraper_returns(scraper)
     return scraper
 
 
-@pytest.fixture
+def _restore_ai_returns(ai):
+    """Point every mocked AI method at its default return value."""
+    ai.analyze_markets.return_value = _SAMPLE_ANALYSIS
+    ai.should_trade.return_value = (True, "OK", 50.0)
+
+
+@pytest.fixture(scope="module")
 def mock_ai():
-    """Create mock AI service."""
+    """Create mock AI service (shared across the module)."""
     ai = MagicMock()
-    ai.analyze_markets = AsyncMock(
-        return_value=AIAnalysisResult(
-            suggestions=[
-                AISuggestion(
-                    market_id="market-001",
-                    recommended_outcome="Yes",
-                    confidence=0.85,
-                )
-            ],
-            markets_analyzed=1,
-        )
-    )
-    ai.should_trade = AsyncMock(return_value=(True, "OK", 50.0))
+    ai.analyze_markets = AsyncMock()
+    ai.should_trade = AsyncMock()
+    _restore_ai_returns(ai)
     return ai
 
 
-@pytest.fixture
+def _restore_trader_returns(trader):
+    """Point every mocked trader method at its default return value."""
+    trader.get_balance.return_value = 1000.0
+    trader.can_trade.return_value = (True, "OK")
+    trader.execute_suggestion.return_value = _SAMPLE_ORDER
+
+
+@pytest.fixture(scope="module")
 def mock_trader():
-    """Create mock trader service."""
+    """Create mock trader service (shared across the module)."""
     trader = MagicMock()
-    trader.get_balance = AsyncMock(return_value=1000.0)
-    trader.can_trade = AsyncMock(return_value=(True, "OK"))
-    trader.execute_suggestion = AsyncMock(
-        return_value=Order(
-            id="order-001",
-            market_id="market-001",
-            outcome="Yes",
-            side="buy",
-            price=0.35,
-            quantity=100,
-            total_value=35.0,
-            status=OrderStatus.FILLED,
-        )
-    )
+    trader.get_balance = AsyncMock()
+    trader.can_trade = AsyncMock()
+    trader.execute_suggestion = AsyncMock()
+    _restore_trader_returns(trader)
     return trader
 
 
-@pytest.fixture
+def _restore_monitor_returns(monitor):
+    """Point every mocked monitor method at its default return value."""
+    monitor.get_positions.return_value = []
+    monitor.update_position_prices.return_value = []
+    monitor.monitor_positions.return_value = {
+        "positions_checked": 0,
+        "sells_triggered": 0,
+        "errors": [],
+    }
+    monitor.get_positions_summary.return_value = {"count": 0}
+
+
+@pytest.fixture(scope="module")
 def mock_monitor():
-    """Create mock monitor service."""
+    """Create mock monitor service (shared across the module)."""
     monitor = MagicMock()
-    monitor.get_positions = AsyncMock(return_value=[])
-    monitor.update_position_prices = AsyncMock(return_value=[])
-    monitor.monitor_positions = AsyncMock(
-        return_value={
-            "positions_checked": 0,
-            "sells_triggered": 0,
-            "errors": [],
-        }
-    )
-    monitor.get_positions_summary = AsyncMock(return_value={"count": 0})
+    monitor.get_positions = AsyncMock()
+    monitor.update_position_prices = AsyncMock()
+    monitor.monitor_positions = AsyncMock()
+    monitor.get_positions_summary = AsyncMock()
+    _restore_monitor_returns(monitor)
     return monitor
 
 
-@pytest.fixture
+def _restore_firestore_returns(client):
+    """Point every mocked Firestore method at its default return value."""
+    client.get_workflow_state.return_value = None
+    client.update_workflow_state.return_value = None
+    client.toggle_workflow.return_value = _SAMPLE_WORKFLOW_STATE
+
+
+@pytest.fixture(scope="module")
 def mock_firestore():
-    """Create mock Firestore client."""
+    """Create mock Firestore client (shared across the module)."""
     client = MagicMock()
-    client.get_workflow_state = AsyncMock(return_value=None)
+    client.get_workflow_state = AsyncMock()
     client.update_workflow_state = AsyncMock()
-    client.toggle_workflow = AsyncMock(
-        return_value=WorkflowState(
-            workflow_id="discovery",
-            mode=TradingMode.FAKE,
-            enabled=True,
-        )
-    )
+    client.toggle_workflow = AsyncMock()
+    _restore_firestore_returns(client)
     return client
 
 
+@pytest.fixture(autouse=True)
+def _reset_orchestrator_mocks(mock_scraper, mock_ai, mock_trader, mock_monitor, mock_firestore):
+    """Restore default mock behavior so per-test overrides don't leak."""
+    method_mocks = (
+        mock_scraper.get_tradeable_markets,
+        mock_scraper.get_filtered_markets,
+        mock_scraper.get_markets,
+        mock_ai.analyze_markets,
+        mock_ai.should_trade,
+        mock_trader.get_balance,
+        mock_trader.can_trade,
+        mock_trader.execute_suggestion,
+        mock_monitor.get_positions,
+        mock_monitor.update_position_prices,
+        mock_monitor.monitor_positions,
+        mock_monitor.get_positions_summary,
+        mock_firestore.get_workflow_state,
+        mock_firestore.update_workflow_state,
+        mock_firestore.toggle_workflow,
+    )
+    for method in method_mocks:
+        method.reset_mock(return_value=True, side_effect=True)
+    _restore_scraper_returns(mock_scraper)
+    _restore_ai_returns(mock_ai)
+    _restore_trader_returns(mock_trader)
+    _restore_monitor_returns(mock_monitor)
+    _restore_firestore_returns(mock_firestore)
+
+
+@pytest.fixture(scope="class")
+def discovery_workflow(mock_settings, mock_scraper, mock_ai, mock_trader):
+    """Create a DiscoveryWorkflow wired to the shared mocks."""
+    return DiscoveryWorkflow(
+        scraper_service=mock_scraper,
+        ai_service=mock_ai,
+        trader_service=mock_trader,
+        settings=mock_settings,
+    )
+
+
+@pytest.fixture(scope="class")
+def monitor_workflow(mock_settings, mock_monitor):
+    """Create a MonitorWorkflow wired to the shared mocks."""
+    return MonitorWorkflow(
+        monitor_service=mock_monitor,
+        settings=mock_settings,
+    )
+
+
 class TestDiscoveryWorkflow:
     """Tests for DiscoveryWorkflow."""
 
-    @pytest.mark.asyncio
-    async def test_run_success(self, mock_settings, mock_scraper, mock_ai, mock_trader):
+    async def test_run_success(self, discovery_workflow):
         """Test successful discovery workflow run."""
-        workflow = DiscoveryWorkflow(
-            scraper_service=mock_scraper,
-            ai_service=mock_ai,
-            trader_service=mock_trader,
-            settings=mock_settings,
-        )
-
-        result = await workflow.run(TradingMode.FAKE)
+        result = await discovery_workflow.run(TradingMode.FAKE)
 
         assert result.success is True
         assert result.workflow_id == "discovery"
         assert result.orders_placed >= 0
 
-    @pytest.mark.asyncio
-    async def test_run_cannot_trade(self, mock_settings, mock_scraper, mock_ai, mock_trader):
+    async def test_run_cannot_trade(self, discovery_workflow, mock_trader):
         """Test workflow when trading is not possible."""
-        mock_trader.can_trade = AsyncMock(return_value=(False, "Insufficient balance"))
-
-        workflow = DiscoveryWorkflow(
-            scraper_service=mock_scraper,
-            ai_service=mock_ai,
-            trader_service=mock_trader,
-            settings=mock_settings,
-        )
+        mock_trader.can_trade.return_value = (False, "Insufficient balance")
 
-        result = await workflow.run(TradingMode.FAKE)
+        result = await discovery_workflow.run(TradingMode.FAKE)
 
         assert result.success is False
         assert len(result.errors) > 0
 
-    @pytest.mark.asyncio
-    async def test_run_no_markets(self, mock_settings, mock_scraper, mock_ai, mock_trader):
+    async def test_run_no_markets(self, discovery_workflow, mock_scraper):
         """Test workflow with no markets found."""
-        mock_scraper.get_tradeable_markets = AsyncMock(return_value=[])
+        mock_scraper.get_tradeable_markets.return_value = []
 
-        workflow = DiscoveryWorkflow(
-            scraper_service=mock_scraper,
-            ai_service=mock_ai,
-            trader_service=mock_trader,
-            settings=mock_settings,
-        )
-
-        result = await workflow.run(TradingMode.FAKE)
+        result = await discovery_workflow.run(TradingMode.FAKE)
 
         assert result.success is True
         assert result.markets_analyzed == 0
 
-    @pytest.mark.asyncio
-    async def test_run_no_suggestions(self, mock_settings, mock_scraper, mock_ai, mock_trader):
+    async def test_run_no_suggestions(self, discovery_workflow, mock_ai):
         """Test workflow with no AI suggestions."""
-        mock_ai.analyze_markets = AsyncMock(
-            return_value=AIAnalysisResult(
-                suggestions=[],
-                markets_analyzed=1,
-            )
-        )
-
-        workflow = DiscoveryWorkflow(
-            scraper_service=mock_scraper,
-            ai_service=mock_ai,
-            trader_service=mock_trader,
-            settings=mock_settings,
+        mock_ai.analyze_markets.return_value = AIAnalysisResult(
+            suggestions=[],
+            markets_analyzed=1,
         )
 
-        result = await workflow.run(TradingMode.FAKE)
+        result = await discovery_workflow.run(TradingMode.FAKE)
 
         assert result.success is True
         assert result.suggestions_generated == 0
@@ -214,117 +288,70 @@ class TestDiscoveryWorkflow:
 class TestMonitorWorkflow:
     """Tests for MonitorWorkflow."""
 
-    @pytest.mark.asyncio
-    async def test_run_success(self, mock_settings, mock_monitor):
+    async def test_run_success(self, monitor_workflow):
         """Test successful monitor workflow run."""
-        workflow = MonitorWorkflow(
-            monitor_service=mock_monitor,
-            settings=mock_settings,
-        )
-
-        result = await workflow.run(TradingMode.FAKE)
+        result = await monitor_workflow.run(TradingMode.FAKE)
 
         assert result.success is True
         assert result.workflow_id == "monitor"
 
-    @pytest.mark.asyncio
-    async def test_run_with_sells(self, mock_settings, mock_monitor):
+    async def test_run_with_sells(self, monitor_workflow, mock_monitor):
         """Test workflow that triggers sells."""
-        mock_monitor.monitor_positions = AsyncMock(
-            return_value={
-                "positions_checked": 3,
-                "sells_triggered": 1,
-                "stop_losses": 1,
-                "take_profits": 0,
-                "errors": [],
-            }
-        )
-
-        workflow = MonitorWorkflow(
-            monitor_service=mock_monitor,
-            settings=mock_settings,
-        )
+        mock_monitor.monitor_positions.return_value = {
+            "positions_checked": 3,
+            "sells_triggered": 1,
+            "stop_losses": 1,
+            "take_profits": 0,
+            "errors": [],
+        }
 
-        result = await workflow.run(TradingMode.FAKE)
+        result = await monitor_workflow.run(TradingMode.FAKE)
 
         assert result.success is True
         assert result.orders_placed == 1
 
 
+@pytest.fixture(scope="class")
+def orchestrator_service(
+    mock_settings, mock_scraper, mock_ai, mock_trader, mock_monitor, mock_firestore
+):
+    """Create an OrchestratorService wired to the shared mocks."""
+    return OrchestratorService(
+        scraper_service=mock_scraper,
+        ai_service=mock_ai,
+        trader_service=mock_trader,
+        monitor_service=mock_monitor,
+        firestore_client=mock_firestore,
+        settings=mock_settings,
+    )
+
+
 class TestOrchestratorService:
     """Tests for OrchestratorService."""
 
-    @pytest.mark.asyncio
-    async def test_run_discovery(
-        self, mock_settings, mock_scraper, mock_ai, mock_trader, mock_monitor, mock_firestore
-    ):
+    async def test_run_discovery(self, orchestrator_service, mock_firestore):
         """Test running discovery workflow through orchestrator."""
-        service = OrchestratorService(
-            scraper_service=mock_scraper,
-            ai_service=mock_ai,
-            trader_service=mock_trader,
-            monitor_service=mock_monitor,
-            firestore_client=mock_firestore,
-            settings=mock_settings,
-        )
-
-        result = await service.run_discovery(TradingMode.FAKE)
+        result = await orchestrator_service.run_discovery(TradingMode.FAKE)
 
         assert isinstance(result, WorkflowRunResult)
         mock_firestore.update_workflow_state.assert_called()
 
-    @pytest.mark.asyncio
-    async def test_run_monitor(
-        self, mock_settings, mock_scraper, mock_ai, mock_trader, mock_monitor, mock_firestore
-    ):
+    async def test_run_monitor(self, orchestrator_service):
         """Test running monitor workflow through orchestrator."""
-        service = OrchestratorService(
-            scraper_service=mock_scraper,
-            ai_service=mock_ai,
-            trader_service=mock_trader,
-            monitor_service=mock_monitor,
-            firestore_client=mock_firestore,
-            settings=mock_settings,
-        )
-
-        result = await service.run_monitor(TradingMode.FAKE)
+        result = await orchestrator_service.run_monitor(TradingMode.FAKE)
 
         assert isinstance(result, WorkflowRunResult)
 
-    @pytest.mark.asyncio
-    async def test_toggle_workflow(
-        self, mock_settings, mock_scraper, mock_ai, mock_trader, mock_monitor, mock_firestore
-    ):
+    async def test_toggle_workflow(self, orchestrator_service, mock_firestore):
         """Test toggling workflow state."""
-        service = OrchestratorService(
-            scraper_service=mock_scraper,
-            ai_service=mock_ai,
-            trader_service=mock_trader,
-            monitor_service=mock_monitor,
-            firestore_client=mock_firestore,
-            settings=mock_settings,
-        )
-
-        state = await service.toggle_workflow("discovery", TradingMode.FAKE, True)
+        state = await orchestrator_service.toggle_workflow("discovery", TradingMode.FAKE, True)
 
         assert state.enabled is True
         mock_firestore.toggle_workflow.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_get_system_status(
-        self, mock_settings, mock_scraper, mock_ai, mock_trader, mock_monitor, mock_firestore
-    ):
+    async def test_get_system_status(self, orchestrator_service):
         """Test getting system status."""
-        service = OrchestratorService(
-            scraper_service=mock_scraper,
-            ai_service=mock_ai,
-            trader_service=mock_trader,
-            monitor_service=mock_monitor,
-            firestore_client=mock_firestore,
-            settings=mock_settings,
-        )
-
-        status = await service.get_system_status()
+        status = await orchestrator_service.get_system_status()
 
         assert "status" in status
         assert "balances" in status
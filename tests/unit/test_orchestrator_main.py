@@ -3,178 +3,183 @@ Unit tests for Orchestrator service FastAPI endpoints.
 """
 
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from pydantic import BaseModel
 
+import services.orchestrator.main as orchestrator_main
+from services.orchestrator.main import app
+from services.orchestrator.service import OrchestratorService
 from shared.models import (
     TradingMode,
     WorkflowRunResult,
     WorkflowState,
 )
 
+# Run every test on the module-scoped loop shared with the client fixture
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
-@pytest.fixture
-def mock_orchestrator_service():
-    """Create a mocked orchestrator service."""
-    service = MagicMock()
-    service.get_system_status = AsyncMock(
-        return_value={
-            "status": "healthy",
-            "mode": "fake",
-            "balance": 1000.0,
-            "positions": 0,
-        }
-    )
-    service.run_discovery = AsyncMock(
-        return_value=WorkflowRunResult(
-            workflow_id="discovery",
-            mode=TradingMode.FAKE,
-            success=True,
-            started_at=datetime.utcnow(),
-            completed_at=datetime.utcnow(),
-            markets_analyzed=10,
-            suggestions_generated=3,
-            orders_placed=2,
-        )
+# Deterministic timestamp; avoids a clock read per fixture instantiation
+_FIXED_NOW = datetime(2025, 1, 1)
+
+
+def _restore_default_returns(service):
+    """Point every mocked service method at its default return value."""
+    service.get_system_status.return_value = {
+        "status": "healthy",
+        "mode": "fake",
+        "balance": 1000.0,
+        "positions": 0,
+    }
+    service.run_discovery.return_value = WorkflowRunResult(
+        workflow_id="discovery",
+        mode=TradingMode.FAKE,
+        success=True,
+        started_at=_FIXED_NOW,
+        completed_at=_FIXED_NOW,
+        markets_analyzed=10,
+        suggestions_generated=3,
+        orders_placed=2,
     )
-    service.run_monitor = AsyncMock(
-        return_value=WorkflowRunResult(
-            workflow_id="monitor",
-            mode=TradingMode.FAKE,
-            success=True,
-            started_at=datetime.utcnow(),
-            completed_at=datetime.utcnow(),
-        )
+    service.run_monitor.return_value = WorkflowRunResult(
+        workflow_id="monitor",
+        mode=TradingMode.FAKE,
+        success=True,
+        started_at=_FIXED_NOW,
+        completed_at=_FIXED_NOW,
     )
-    service.toggle_workflow = AsyncMock(
-        return_value=WorkflowState(
-            workflow_id="discovery",
-            mode=TradingMode.FAKE,
-            enabled=True,
-        )
+    service.toggle_workflow.return_value = WorkflowState(
+        workflow_id="discovery",
+        mode=TradingMode.FAKE,
+        enabled=True,
     )
-    service.get_workflow_state = AsyncMock(
-        return_value=WorkflowState(
-            workflow_id="discovery",
-            mode=TradingMode.FAKE,
-            enabled=True,
-        )
+    service.get_workflow_state.return_value = WorkflowState(
+        workflow_id="discovery",
+        mode=TradingMode.FAKE,
+        enabled=True,
     )
-    service.get_markets = AsyncMock(return_value=[])
-    service.get_positions = AsyncMock(return_value=[])
-    service.get_balance = AsyncMock(return_value=1000.0)
+    service.get_markets.return_value = []
+    service.get_positions.return_value = []
+    service.get_balance.return_value = 1000.0
+
+
+@pytest.fixture(scope="module")
+def mock_orchestrator_service():
+    """Create a mocked orchestrator service (shared across the module).
+
+    spec keeps the mock's surface limited to the real interface, so a typo'd
+    method in a test raises instead of silently minting a child mock; the
+    async methods automatically become AsyncMock.
+    """
+    service = MagicMock(spec=OrchestratorService)
+    _restore_default_returns(service)
     return service
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def _reset_orchestrator_service(mock_orchestrator_service):
+    """Restore default mock behavior so per-test overrides don't leak."""
+    for method in (
+        mock_orchestrator_service.get_system_status,
+        mock_orchestrator_service.run_discovery,
+        mock_orchestrator_service.run_monitor,
+        mock_orchestrator_service.toggle_workflow,
+        mock_orchestrator_service.get_workflow_state,
+        mock_orchestrator_service.get_markets,
+        mock_orchestrator_service.get_positions,
+        mock_orchestrator_service.get_balance,
+    ):
+        method.reset_mock(return_value=True, side_effect=True)
+    _restore_default_returns(mock_orchestrator_service)
+
+
+@pytest.fixture(scope="module")
 def sample_workflow_result():
-    """Create a sample workflow result."""
+    """Create a sample workflow result (copy before mutating)."""
     return WorkflowRunResult(
         workflow_id="discovery",
         mode=TradingMode.FAKE,
         success=True,
-        started_at=datetime.utcnow(),
-        completed_at=datetime.utcnow(),
+        started_at=_FIXED_NOW,
+        completed_at=_FIXED_NOW,
         markets_analyzed=10,
         suggestions_generated=3,
         orders_placed=2,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_workflow_state():
-    """Create a sample workflow state."""
+    """Create a sample workflow state (copy before mutating)."""
     return WorkflowState(
         workflow_id="discovery",
         mode=TradingMode.FAKE,
         enabled=True,
-        last_run=datetime.utcnow(),
+        last_run=_FIXED_NOW,
         run_count=5,
     )
 
 
-@pytest.fixture
-def client(mock_orchestrator_service):
-    """Create test client with mocked service."""
-    with patch("services.orchestrator.main._orchestrator", None):
-        with patch(
-            "services.orchestrator.main.get_orchestrator_service",
-            return_value=mock_orchestrator_service,
-        ):
-            import services.orchestrator.main as orchestrator_main
-            from services.orchestrator.main import app
-
-            # Reset service instance
-            orchestrator_main._orchestrator = None
-
-            with TestClient(app) as test_client:
-                yield test_client
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def client(mock_orchestrator_service):
+    """Create an in-process async client with the mocked service installed."""
+    app.dependency_overrides[orchestrator_main.get_service] = lambda: mock_orchestrator_service
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as async_client:
+        yield async_client
+    app.dependency_overrides.pop(orchestrator_main.get_service, None)
 
 
 class TestHealthEndpoints:
     """Tests for health check endpoints."""
 
-    def test_health_check(self, client):
+    async def test_health_check(self, client):
         """Test health check endpoint returns healthy status."""
-        response = client.get("/health")
+        response = await client.get("/health")
 
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "healthy"
         assert data["version"] == "0.1.0"
 
-    def test_readiness_check(self, client):
+    async def test_readiness_check(self, client):
         """Test readiness check endpoint."""
-        response = client.get("/ready")
+        response = await client.get("/ready")
 
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "ready"
 
-    def test_system_status(self, client, mock_orchestrator_service):
+    async def test_system_status(self, client, mock_orchestrator_service):
         """Test system status endpoint."""
-        mock_orchestrator_service.get_system_status = AsyncMock(
-            return_value={
-                "status": "healthy",
-                "mode": "fake",
-                "balance": 1000.0,
-                "positions": 3,
-                "workflows": {"discovery": True, "monitor": True},
-            }
-        )
+        mock_orchestrator_service.get_system_status.return_value = {
+            "status": "healthy",
+            "mode": "fake",
+            "balance": 1000.0,
+            "positions": 3,
+            "workflows": {"discovery": True, "monitor": True},
+        }
 
-        response = client.get("/status")
+        response = await client.get("/status")
 
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "healthy"
         assert data["balance"] == 1000.0
 
-    def test_system_status_error(self, client, mock_orchestrator_service):
-        """Test status error handling."""
-        mock_orchestrator_service.get_system_status = AsyncMock(
-            side_effect=Exception("Status Error")
-        )
-
-        response = client.get("/status")
-
-        assert response.status_code == 500
-
-
 class TestWorkflowEndpoints:
     """Tests for workflow endpoints."""
 
-    def test_trigger_discovery_fake(
+    async def test_trigger_discovery_fake(
         self, client, mock_orchestrator_service, sample_workflow_result
     ):
         """Test triggering discovery workflow in fake mode."""
-        mock_orchestrator_service.run_discovery = AsyncMock(
-            return_value=sample_workflow_result
-        )
+        mock_orchestrator_service.run_discovery.return_value = sample_workflow_result
 
-        response = client.post(
+        response = await client.post(
             "/workflow/discover",
             json={"mode": "fake"},
         )
@@ -185,16 +190,15 @@ class TestWorkflowEndpoints:
         assert data["success"] is True
         assert data["markets_analyzed"] == 10
 
-    def test_trigger_discovery_real(
+    async def test_trigger_discovery_real(
         self, client, mock_orchestrator_service, sample_workflow_result
     ):
         """Test triggering discovery workflow in real mode."""
-        sample_workflow_result.mode = TradingMode.REAL
-        mock_orchestrator_service.run_discovery = AsyncMock(
-            return_value=sample_workflow_result
+        mock_orchestrator_service.run_discovery.return_value = sample_workflow_result.model_copy(
+            update={"mode": TradingMode.REAL}
         )
 
-        response = client.post(
+        response = await client.post(
             "/workflow/discover",
             json={"mode": "real"},
         )
@@ -203,31 +207,18 @@ class TestWorkflowEndpoints:
         data = response.json()
         assert data["mode"] == "real"
 
-    def test_trigger_discovery_error(self, client, mock_orchestrator_service):
-        """Test discovery workflow error handling."""
-        mock_orchestrator_service.run_discovery = AsyncMock(
-            side_effect=Exception("Discovery Error")
-        )
-
-        response = client.post(
-            "/workflow/discover",
-            json={"mode": "fake"},
-        )
-
-        assert response.status_code == 500
-
-    def test_trigger_monitor(self, client, mock_orchestrator_service):
+    async def test_trigger_monitor(self, client, mock_orchestrator_service):
         """Test triggering monitor workflow."""
         monitor_result = WorkflowRunResult(
             workflow_id="monitor",
             mode=TradingMode.FAKE,
             success=True,
-            started_at=datetime.utcnow(),
-            completed_at=datetime.utcnow(),
+            started_at=_FIXED_NOW,
+            completed_at=_FIXED_NOW,
         )
-        mock_orchestrator_service.run_monitor = AsyncMock(return_value=monitor_result)
+        mock_orchestrator_service.run_monitor.return_value = monitor_result
 
-        response = client.post(
+        response = await client.post(
             "/workflow/monitor",
             json={"mode": "fake"},
         )
@@ -237,28 +228,13 @@ class TestWorkflowEndpoints:
         assert data["workflow_id"] == "monitor"
         assert data["success"] is True
 
-    def test_trigger_monitor_error(self, client, mock_orchestrator_service):
-        """Test monitor workflow error handling."""
-        mock_orchestrator_service.run_monitor = AsyncMock(
-            side_effect=Exception("Monitor Error")
-        )
-
-        response = client.post(
-            "/workflow/monitor",
-            json={"mode": "fake"},
-        )
-
-        assert response.status_code == 500
-
-    def test_toggle_workflow_enable(
+    async def test_toggle_workflow_enable(
         self, client, mock_orchestrator_service, sample_workflow_state
     ):
         """Test enabling a workflow."""
-        mock_orchestrator_service.toggle_workflow = AsyncMock(
-            return_value=sample_workflow_state
-        )
+        mock_orchestrator_service.toggle_workflow.return_value = sample_workflow_state
 
-        response = client.post(
+        response = await client.post(
             "/workflow/toggle",
             json={
                 "workflow_id": "discovery",
@@ -273,16 +249,15 @@ class TestWorkflowEndpoints:
         assert data["workflow_id"] == "discovery"
         assert data["enabled"] is True
 
-    def test_toggle_workflow_disable(
+    async def test_toggle_workflow_disable(
         self, client, mock_orchestrator_service, sample_workflow_state
     ):
         """Test disabling a workflow."""
-        sample_workflow_state.enabled = False
-        mock_orchestrator_service.toggle_workflow = AsyncMock(
-            return_value=sample_workflow_state
+        mock_orchestrator_service.toggle_workflow.return_value = sample_workflow_state.model_copy(
+            update={"enabled": False}
         )
 
-        response = client.post(
+        response = await client.post(
             "/workflow/toggle",
             json={
                 "workflow_id": "discovery",
@@ -295,144 +270,86 @@ class TestWorkflowEndpoints:
         data = response.json()
         assert data["enabled"] is False
 
-    def test_toggle_workflow_error(self, client, mock_orchestrator_service):
-        """Test toggle workflow error handling."""
-        mock_orchestrator_service.toggle_workflow = AsyncMock(
-            side_effect=Exception("Toggle Error")
-        )
-
-        response = client.post(
-            "/workflow/toggle",
-            json={
-                "workflow_id": "discovery",
-                "mode": "fake",
-                "enabled": True,
-            },
-        )
-
-        assert response.status_code == 500
-
-    def test_get_workflow_state_exists(
+    async def test_get_workflow_state_exists(
         self, client, mock_orchestrator_service, sample_workflow_state
     ):
         """Test getting existing workflow state."""
-        mock_orchestrator_service.get_workflow_state = AsyncMock(
-            return_value=sample_workflow_state
-        )
+        mock_orchestrator_service.get_workflow_state.return_value = sample_workflow_state
 
-        response = client.get("/workflow/discovery/state?mode=fake")
+        response = await client.get("/workflow/discovery/state?mode=fake")
 
         assert response.status_code == 200
         data = response.json()
         assert data["exists"] is True
         assert data["workflow_id"] == "discovery"
 
-    def test_get_workflow_state_not_exists(self, client, mock_orchestrator_service):
+    async def test_get_workflow_state_not_exists(self, client, mock_orchestrator_service):
         """Test getting non-existent workflow state."""
-        mock_orchestrator_service.get_workflow_state = AsyncMock(return_value=None)
+        mock_orchestrator_service.get_workflow_state.return_value = None
 
-        response = client.get("/workflow/unknown/state?mode=fake")
+        response = await client.get("/workflow/unknown/state?mode=fake")
 
         assert response.status_code == 200
         data = response.json()
         assert data["exists"] is False
 
-    def test_get_workflow_state_error(self, client, mock_orchestrator_service):
-        """Test workflow state error handling."""
-        mock_orchestrator_service.get_workflow_state = AsyncMock(
-            side_effect=Exception("State Error")
-        )
-
-        response = client.get("/workflow/discovery/state?mode=fake")
-
-        assert response.status_code == 500
-
-
 class TestMarketEndpoints:
     """Tests for market endpoints."""
 
-    def test_get_markets_filtered(self, client, mock_orchestrator_service):
+    async def test_get_markets_filtered(self, client, mock_orchestrator_service):
         """Test getting filtered markets."""
-        mock_orchestrator_service.get_markets = AsyncMock(
-            return_value=[
-                {"id": "market-001", "question": "Will BTC hit $100k?"},
-                {"id": "market-002", "question": "Will ETH flip BTC?"},
-            ]
-        )
+        mock_orchestrator_service.get_markets.return_value = [
+            {"id": "market-001", "question": "Will BTC hit $100k?"},
+            {"id": "market-002", "question": "Will ETH flip BTC?"},
+        ]
 
-        response = client.get("/markets?limit=10&filtered=true")
+        response = await client.get("/markets?limit=10&filtered=true")
 
         assert response.status_code == 200
         data = response.json()
         assert len(data) == 2
 
-    def test_get_markets_unfiltered(self, client, mock_orchestrator_service):
+    async def test_get_markets_unfiltered(self, client, mock_orchestrator_service):
         """Test getting unfiltered markets."""
-        mock_orchestrator_service.get_markets = AsyncMock(
-            return_value=[{"id": "market-001"}]
-        )
+        mock_orchestrator_service.get_markets.return_value = [{"id": "market-001"}]
 
-        response = client.get("/markets?filtered=false")
+        response = await client.get("/markets?filtered=false")
 
         assert response.status_code == 200
 
-    def test_get_markets_error(self, client, mock_orchestrator_service):
-        """Test markets error handling."""
-        mock_orchestrator_service.get_markets = AsyncMock(
-            side_effect=Exception("Markets Error")
-        )
-
-        response = client.get("/markets")
-
-        assert response.status_code == 500
-
-
 class TestPositionEndpoints:
     """Tests for position endpoints."""
 
-    def test_get_positions_fake(self, client, mock_orchestrator_service):
+    async def test_get_positions_fake(self, client, mock_orchestrator_service):
         """Test getting fake mode positions."""
-        mock_orchestrator_service.get_positions = AsyncMock(
-            return_value=[
-                {"id": "pos-001", "market_id": "market-001", "pnl_percent": 10.0}
-            ]
-        )
+        mock_orchestrator_service.get_positions.return_value = [
+            {"id": "pos-001", "market_id": "market-001", "pnl_percent": 10.0}
+        ]
 
-        response = client.get("/positions/fake")
+        response = await client.get("/positions/fake")
 
         assert response.status_code == 200
         data = response.json()
         assert len(data) == 1
 
-    def test_get_positions_real(self, client, mock_orchestrator_service):
+    async def test_get_positions_real(self, client, mock_orchestrator_service):
         """Test getting real mode positions."""
-        mock_orchestrator_service.get_positions = AsyncMock(return_value=[])
+        mock_orchestrator_service.get_positions.return_value = []
 
-        response = client.get("/positions/real")
+        response = await client.get("/positions/real")
 
         assert response.status_code == 200
         data = response.json()
         assert len(data) == 0
 
-    def test_get_positions_error(self, client, mock_orchestrator_service):
-        """Test positions error handling."""
-        mock_orchestrator_service.get_positions = AsyncMock(
-            side_effect=Exception("Positions Error")
-        )
-
-        response = client.get("/positions/fake")
-
-        assert response.status_code == 500
-
-
 class TestBalanceEndpoints:
     """Tests for balance endpoints."""
 
-    def test_get_balance_fake(self, client, mock_orchestrator_service):
+    async def test_get_balance_fake(self, client, mock_orchestrator_service):
         """Test getting fake mode balance."""
-        mock_orchestrator_service.get_balance = AsyncMock(return_value=1000.0)
+        mock_orchestrator_service.get_balance.return_value = 1000.0
 
-        response = client.get("/balance/fake")
+        response = await client.get("/balance/fake")
 
         assert response.status_code == 200
         data = response.json()
@@ -440,64 +357,99 @@ class TestBalanceEndpoints:
         assert data["balance"] == 1000.0
         assert data["available_for_trading"] is True
 
-    def test_get_balance_real(self, client, mock_orchestrator_service):
+    async def test_get_balance_real(self, client, mock_orchestrator_service):
         """Test getting real mode balance."""
-        mock_orchestrator_service.get_balance = AsyncMock(return_value=500.0)
+        mock_orchestrator_service.get_balance.return_value = 500.0
 
-        response = client.get("/balance/real")
+        response = await client.get("/balance/real")
 
         assert response.status_code == 200
         data = response.json()
         assert data["mode"] == "real"
 
-    def test_get_balance_low(self, client, mock_orchestrator_service):
+    async def test_get_balance_low(self, client, mock_orchestrator_service):
         """Test balance below trading threshold."""
-        mock_orchestrator_service.get_balance = AsyncMock(return_value=5.0)
+        mock_orchestrator_service.get_balance.return_value = 5.0
 
-        response = client.get("/balance/fake")
+        response = await client.get("/balance/fake")
 
         assert response.status_code == 200
         data = response.json()
         assert data["available_for_trading"] is False
 
-    def test_get_balance_error(self, client, mock_orchestrator_service):
-        """Test balance error handling."""
-        mock_orchestrator_service.get_balance = AsyncMock(
-            side_effect=Exception("Balance Error")
-        )
+class _TradingConfigResponse(BaseModel):
+    """Expected shape of the /config response, validated in one pass."""
 
-        response = client.get("/balance/fake")
+    min_balance_to_trade: float
+    max_bet_amount: float
+    max_positions: int
+
+
+class _MarketFiltersResponse(BaseModel):
+    min_volume: float
+    max_time_to_resolution_hours: float
+
+
+class _AIConfigResponse(BaseModel):
+    model: str
+    max_suggestions: int
+
+
+class _FeatureFlagsResponse(BaseModel):
+    real_money_enabled: bool
+    fake_money_enabled: bool
 
-        assert response.status_code == 500
+
+class _ConfigResponse(BaseModel):
+    trading: _TradingConfigResponse
+    market_filters: _MarketFiltersResponse
+    ai: _AIConfigResponse
+    feature_flags: _FeatureFlagsResponse
 
 
 class TestConfigEndpoints:
     """Tests for configuration endpoints."""
 
-    def test_get_config(self, client):
+    async def test_get_config(self, client):
         """Test getting system configuration."""
-        response = client.get("/config")
+        response = await client.get("/config")
 
         assert response.status_code == 200
-        data = response.json()
-        assert "trading" in data
-        assert "market_filters" in data
-        assert "ai" in data
-        assert "feature_flags" in data
-
-        # Check trading config
-        assert "min_balance_to_trade" in data["trading"]
-        assert "max_bet_amount" in data["trading"]
-        assert "max_positions" in data["trading"]
-
-        # Check market filters
-        assert "min_volume" in data["market_filters"]
-        assert "max_time_to_resolution_hours" in data["market_filters"]
-
-        # Check AI config
-        assert "model" in data["ai"]
-        assert "max_suggestions" in data["ai"]
-
-        # Check feature flags
-        assert "real_money_enabled" in data["feature_flags"]
-        assert "fake_money_enabled" in data["feature_flags"]
+        # One pydantic-core pass replaces the key-by-key membership checks and
+        # also type-checks every field.
+        _ConfigResponse.model_validate(response.json())
+
+
+class TestErrorHandling:
+    """Tests for endpoint error handling."""
+
+    @pytest.mark.parametrize(
+        ("method", "http_method", "url", "json_body"),
+        [
+            ("get_system_status", "GET", "/status", None),
+            ("run_discovery", "POST", "/workflow/discover", {"mode": "fake"}),
+            ("run_monitor", "POST", "/workflow/monitor", {"mode": "fake"}),
+            (
+                "toggle_workflow",
+                "POST",
+                "/workflow/toggle",
+                {"workflow_id": "discovery", "mode": "fake", "enabled": True},
+            ),
+            ("get_workflow_state", "GET", "/workflow/discovery/state?mode=fake", None),
+            ("get_markets", "GET", "/markets", None),
+            ("get_positions", "GET", "/positions/fake", None),
+            ("get_balance", "GET", "/balance/fake", None),
+        ],
+    )
+    async def test_endpoint_error(
+        self, client, mock_orchestrator_service, method, http_method, url, json_body
+    ):
+        """Test each endpoint returns 500 when its service call raises."""
+        getattr(mock_orchestrator_service, method).side_effect = Exception("Service Error")
+
+        if http_method == "GET":
+            response = await client.get(url)
+        else:
+            response = await client.post(url, json=json_body)
+
+        assert response.status_code == 500
@@ -2,8 +2,9 @@
 Unit tests for scraper service.
 """
 
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -11,23 +12,32 @@ from services.scraper.service import ScraperService, get_scraper_service
 from shared.models import Market, MarketOutcome
 
 
-@pytest.fixture
+@dataclass(frozen=True)
+class _MarketFiltersConfig:
+    """Plain settings stand-in with direct attribute access."""
+
+    min_volume: int = 1000
+    max_time_to_resolution_hours: float = 1.0
+    min_liquidity: int = 500
+    excluded_categories: tuple[str, ...] = ("sports", "entertainment")
+    min_price: float = 0.05
+    max_price: float = 0.95
+
+
+@dataclass(frozen=True)
+class _ScraperSettings:
+    market_filters: _MarketFiltersConfig = field(default_factory=_MarketFiltersConfig)
+
+
+@pytest.fixture(scope="module")
 def mock_settings():
-    """Create mock settings."""
-    settings = MagicMock()
-    settings.market_filters = MagicMock()
-    settings.market_filters.min_volume = 1000
-    settings.market_filters.max_time_to_resolution_hours = 1.0
-    settings.market_filters.min_liquidity = 500
-    settings.market_filters.excluded_categories = ["sports", "entertainment"]
-    settings.market_filters.min_price = 0.05
-    settings.market_filters.max_price = 0.95
-    return settings
-
-
-@pytest.fixture
+    """Create lightweight settings for scraper tests."""
+    return _ScraperSettings()
+
+
+@pytest.fixture(scope="module")
 def sample_markets():
-    """Create sample markets for testing."""
+    """Create sample markets once; tests only read them."""
     return [
         Market(
             id="market-001",
@@ -56,70 +66,65 @@ def sample_markets():
     ]
 
 
+@pytest.fixture(scope="module")
+def mock_polymarket_client(sample_markets):
+    """Create mock Polymarket client wired to the sample markets."""
+    client = MagicMock()
+    client.get_markets = AsyncMock(return_value=sample_markets)
+    client.get_markets_parallel = AsyncMock(return_value=sample_markets)
+    client.__aenter__ = AsyncMock(return_value=client)
+    client.__aexit__ = AsyncMock(return_value=None)
+    return client
+
+
+@pytest.fixture(autouse=True)
+def _reset_polymarket_client(mock_polymarket_client, sample_markets):
+    """Restore default mock behavior so per-test overrides don't leak."""
+    for method in (
+        mock_polymarket_client.get_markets,
+        mock_polymarket_client.get_markets_parallel,
+    ):
+        method.reset_mock(return_value=True, side_effect=True)
+        method.return_value = sample_markets
+
+
+@pytest.fixture(scope="module")
+def scraper_service(mock_polymarket_client, mock_settings):
+    """Create a ScraperService wired to the shared mocks."""
+    return ScraperService(
+        polymarket_client=mock_polymarket_client,
+        settings=mock_settings,
+    )
+
+
 class TestScraperService:
     """Tests for ScraperService."""
 
-    @pytest.mark.asyncio
-    async def test_get_markets(self, mock_settings, sample_markets):
+    async def test_get_markets(self, scraper_service, mock_polymarket_client):
         """Test fetching markets."""
-        mock_client = MagicMock()
-        mock_client.get_markets = AsyncMock(return_value=sample_markets)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
-
-        service = ScraperService(
-            polymarket_client=mock_client,
-            settings=mock_settings,
-        )
-
-        markets = await service.get_markets(limit=10)
+        markets = await scraper_service.get_markets(limit=10)
 
         assert len(markets) == 2
-        mock_client.get_markets.assert_called_once()
+        mock_polymarket_client.get_markets.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_get_filtered_markets(self, mock_settings, sample_markets):
+    async def test_get_filtered_markets(self, scraper_service):
         """Test fetching and filtering markets."""
-        mock_client = MagicMock()
-        mock_client.get_markets = AsyncMock(return_value=sample_markets)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
-
-        service = ScraperService(
-            polymarket_client=mock_client,
-            settings=mock_settings,
-        )
-
-        filtered, summary = await service.get_filtered_markets(limit=10)
+        filtered, summary = await scraper_service.get_filtered_markets(limit=10)
 
         # market-002 should be filtered (time > 1 hour)
         assert len(filtered) == 1
         assert filtered[0].id == "market-001"
 
-    @pytest.mark.asyncio
-    async def test_get_tradeable_markets(self, mock_settings, sample_markets):
+    async def test_get_tradeable_markets(self, scraper_service):
         """Test getting tradeable markets sorted by volume."""
-        mock_client = MagicMock()
-        mock_client.get_markets = AsyncMock(return_value=sample_markets)
-        mock_client.get_markets_parallel = AsyncMock(return_value=sample_markets)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=None)
-
-        service = ScraperService(
-            polymarket_client=mock_client,
-            settings=mock_settings,
-        )
-
-        tradeable = await service.get_tradeable_markets(max_markets=5)
+        tradeable = await scraper_service.get_tradeable_markets(max_markets=5)
 
         # Should return filtered markets
         assert len(tradeable) <= 5
 
-    def test_apply_custom_filter_category(self, mock_settings, sample_markets):
+    def test_apply_custom_filter_category(self, scraper_service, sample_markets):
         """Test custom filter by category."""
-        service = ScraperService(settings=mock_settings)
-
-        filtered = service.apply_custom_filter(
+        filtered = scraper_service.apply_custom_filter(
             sample_markets,
             category="crypto",
         )
@@ -127,11 +132,9 @@ class TestScraperService:
         assert len(filtered) == 1
         assert filtered[0].category == "crypto"
 
-    def test_apply_custom_filter_volume(self, mock_settings, sample_markets):
+    def test_apply_custom_filter_volume(self, scraper_service, sample_markets):
         """Test custom filter by volume."""
-        service = ScraperService(settings=mock_settings)
-
-        filtered = service.apply_custom_filter(
+        filtered = scraper_service.apply_custom_filter(
             sample_markets,
             min_volume=8000,
         )
@@ -145,9 +148,8 @@ class TestGetScraperService:
 
     def test_get_scraper_service(self):
         """Test factory creates service."""
-        with patch("services.scraper.service.get_settings") as mock_get_settings:
-            mock_get_settings.return_value = MagicMock()
-
-            service = get_scraper_service()
+        # pytest-antilru clears the get_settings lru_cache between tests,
+        # so the real (test-env) settings can be used directly here.
+        service = get_scraper_service()
 
-            assert isinstance(service, ScraperService)
+        assert isinstance(service, ScraperService)
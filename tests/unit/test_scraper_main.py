@@ -2,35 +2,68 @@
 Unit tests for Scraper service FastAPI endpoints.
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
 
+import services.scraper.main as scraper_main
+from services.scraper.main import app
 from shared.models import Market, MarketOutcome
 
+# Run every test on the module-scoped loop shared with the client fixture
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
-@pytest.fixture
+# Deterministic future end date; avoids a clock read per fixture instantiation
+_FIXED_END = datetime(2099, 1, 1)
+
+
+def _restore_default_returns(service):
+    """Point every mocked service method at its default return value."""
+    service.get_markets.return_value = []
+    service.get_filtered_markets.return_value = ([], {})
+    service.get_tradeable_markets.return_value = []
+    service.get_market.return_value = None
+    service.apply_custom_filter.return_value = []
+
+
+@pytest.fixture(scope="module")
 def mock_scraper_service():
-    """Create a mocked scraper service."""
+    """Create a mocked scraper service (shared across the module)."""
     service = MagicMock()
-    service.get_markets = AsyncMock(return_value=[])
-    service.get_filtered_markets = AsyncMock(return_value=([], {}))
-    service.get_tradeable_markets = AsyncMock(return_value=[])
-    service.get_market = AsyncMock(return_value=None)
-    service.apply_custom_filter = MagicMock(return_value=[])
+    service.get_markets = AsyncMock()
+    service.get_filtered_markets = AsyncMock()
+    service.get_tradeable_markets = AsyncMock()
+    service.get_market = AsyncMock()
+    service.apply_custom_filter = MagicMock()
+    _restore_default_returns(service)
     return service
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def _reset_scraper_service(mock_scraper_service):
+    """Restore default mock behavior so per-test overrides don't leak."""
+    for method in (
+        mock_scraper_service.get_markets,
+        mock_scraper_service.get_filtered_markets,
+        mock_scraper_service.get_tradeable_markets,
+        mock_scraper_service.get_market,
+        mock_scraper_service.apply_custom_filter,
+    ):
+        method.reset_mock(return_value=True, side_effect=True)
+    _restore_default_returns(mock_scraper_service)
+
+
+@pytest.fixture(scope="module")
 def sample_market():
-    """Create a sample market."""
+    """Create a sample market (shared across the module)."""
     return Market(
         id="market-001",
         question="Will BTC reach $100k?",
         category="crypto",
-        end_date=datetime.utcnow() + timedelta(hours=1),
+        end_date=_FIXED_END,
         volume=50000,
         liquidity=25000,
         outcomes=[
@@ -40,39 +73,39 @@ def sample_market():
     )
 
 
-@pytest.fixture
-def client(mock_scraper_service):
-    """Create test client with mocked service."""
-    with patch("services.scraper.main._scraper_service", None):
-        with patch(
-            "services.scraper.main.get_scraper_service",
-            return_value=mock_scraper_service,
-        ):
-            import services.scraper.main as scraper_main
-            from services.scraper.main import app
+@pytest.fixture(scope="module")
+def sample_market_json(sample_market):
+    """Serialize the sample market once for response assertions."""
+    return sample_market.model_dump(mode="json")
 
-            # Reset service instance
-            scraper_main._scraper_service = None
 
-            with TestClient(app) as test_client:
-                yield test_client
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def client(mock_scraper_service):
+    """Create an in-process async client with the mocked service installed."""
+    with (
+        patch.object(scraper_main, "_scraper_service", None),
+        patch.object(scraper_main, "get_scraper_service", return_value=mock_scraper_service),
+    ):
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as async_client:
+            yield async_client
 
 
 class TestHealthEndpoints:
     """Tests for health check endpoints."""
 
-    def test_health_check(self, client):
+    async def test_health_check(self, client):
         """Test health check endpoint returns healthy status."""
-        response = client.get("/health")
+        response = await client.get("/health")
 
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "healthy"
         assert data["version"] == "0.1.0"
 
-    def test_readiness_check(self, client):
+    async def test_readiness_check(self, client):
         """Test readiness check endpoint."""
-        response = client.get("/ready")
+        response = await client.get("/ready")
 
         assert response.status_code == 200
         data = response.json()
@@ -82,58 +115,44 @@ class TestHealthEndpoints:
 class TestMarketEndpoints:
     """Tests for market endpoints."""
 
-    def test_get_markets_filtered(self, client, mock_scraper_service, sample_market):
+    async def test_get_markets_filtered(
+        self, client, mock_scraper_service, sample_market, sample_market_json
+    ):
         """Test getting filtered markets."""
-        mock_scraper_service.get_filtered_markets = AsyncMock(
-            return_value=([sample_market], {"total": 1, "filtered": 1})
-        )
+        mock_scraper_service.get_filtered_markets.return_value = ([sample_market], {"total": 1, "filtered": 1})
 
-        response = client.get("/markets?filtered=true&limit=10")
+        response = await client.get("/markets?filtered=true&limit=10")
 
         assert response.status_code == 200
         data = response.json()
-        assert len(data) == 1
-        assert data[0]["id"] == "market-001"
+        assert data == [sample_market_json]
 
-    def test_get_markets_unfiltered(self, client, mock_scraper_service, sample_market):
+    async def test_get_markets_unfiltered(self, client, mock_scraper_service, sample_market):
         """Test getting unfiltered markets."""
-        mock_scraper_service.get_markets = AsyncMock(return_value=[sample_market])
+        mock_scraper_service.get_markets.return_value = [sample_market]
 
-        response = client.get("/markets?filtered=false&limit=10")
+        response = await client.get("/markets?filtered=false&limit=10")
 
         assert response.status_code == 200
         data = response.json()
         assert len(data) == 1
 
-    def test_get_markets_with_pagination(self, client, mock_scraper_service):
+    async def test_get_markets_with_pagination(self, client, mock_scraper_service):
         """Test market pagination parameters."""
-        mock_scraper_service.get_filtered_markets = AsyncMock(return_value=([], {}))
+        mock_scraper_service.get_filtered_markets.return_value = ([], {})
 
-        response = client.get("/markets?limit=25&offset=10")
+        response = await client.get("/markets?limit=25&offset=10")
 
         assert response.status_code == 200
         mock_scraper_service.get_filtered_markets.assert_called_once_with(
             limit=25, offset=10
         )
 
-    def test_get_markets_error(self, client, mock_scraper_service):
-        """Test market endpoint error handling."""
-        mock_scraper_service.get_filtered_markets = AsyncMock(
-            side_effect=Exception("API Error")
-        )
-
-        response = client.get("/markets")
-
-        assert response.status_code == 500
-        assert "API Error" in response.json()["detail"]
-
-    def test_get_tradeable_markets(self, client, mock_scraper_service, sample_market):
+    async def test_get_tradeable_markets(self, client, mock_scraper_service, sample_market):
         """Test getting tradeable markets."""
-        mock_scraper_service.get_tradeable_markets = AsyncMock(
-            return_value=[sample_market]
-        )
+        mock_scraper_service.get_tradeable_markets.return_value = [sample_market]
 
-        response = client.get("/markets/tradeable?max_markets=5")
+        response = await client.get("/markets/tradeable?max_markets=5")
 
         assert response.status_code == 200
         data = response.json()
@@ -142,60 +161,35 @@ class TestMarketEndpoints:
             max_markets=5
         )
 
-    def test_get_tradeable_markets_error(self, client, mock_scraper_service):
-        """Test tradeable markets error handling."""
-        mock_scraper_service.get_tradeable_markets = AsyncMock(
-            side_effect=Exception("Service Error")
-        )
-
-        response = client.get("/markets/tradeable")
-
-        assert response.status_code == 500
-
-    def test_get_market_by_id(self, client, mock_scraper_service, sample_market):
+    async def test_get_market_by_id(
+        self, client, mock_scraper_service, sample_market, sample_market_json
+    ):
         """Test getting a specific market by ID."""
-        mock_scraper_service.get_market = AsyncMock(return_value=sample_market)
+        mock_scraper_service.get_market.return_value = sample_market
 
-        response = client.get("/markets/market-001")
+        response = await client.get("/markets/market-001")
 
         assert response.status_code == 200
-        data = response.json()
-        assert data["id"] == "market-001"
-        assert data["question"] == "Will BTC reach $100k?"
+        assert response.json() == sample_market_json
 
-    def test_get_market_not_found(self, client, mock_scraper_service):
+    async def test_get_market_not_found(self, client, mock_scraper_service):
         """Test getting a non-existent market."""
-        mock_scraper_service.get_market = AsyncMock(return_value=None)
+        mock_scraper_service.get_market.return_value = None
 
-        response = client.get("/markets/nonexistent")
+        response = await client.get("/markets/nonexistent")
 
         assert response.status_code == 404
         assert "not found" in response.json()["detail"]
 
-    def test_get_market_error(self, client, mock_scraper_service):
-        """Test market by ID error handling."""
-        mock_scraper_service.get_market = AsyncMock(
-            side_effect=Exception("Database error")
-        )
-
-        response = client.get("/markets/market-001")
-
-        assert response.status_code == 500
-
-
 class TestFilterEndpoints:
     """Tests for filter endpoints."""
 
-    def test_filter_markets_basic(self, client, mock_scraper_service, sample_market):
+    async def test_filter_markets_basic(self, client, mock_scraper_service, sample_market):
         """Test filtering markets with basic parameters."""
-        mock_scraper_service.get_filtered_markets = AsyncMock(
-            return_value=([sample_market], {"total": 10, "filtered": 1})
-        )
-        mock_scraper_service.apply_custom_filter = MagicMock(
-            return_value=[sample_market]
-        )
+        mock_scraper_service.get_filtered_markets.return_value = ([sample_market], {"total": 10, "filtered": 1})
+        mock_scraper_service.apply_custom_filter.return_value = [sample_market]
 
-        response = client.post("/markets/filter?limit=10")
+        response = await client.post("/markets/filter?limit=10")
 
         assert response.status_code == 200
         data = response.json()
@@ -204,73 +198,35 @@ class TestFilterEndpoints:
         assert "filter_summary" in data
         assert "applied_filters" in data
 
-    def test_filter_markets_with_category(
-        self, client, mock_scraper_service, sample_market
+    @pytest.mark.parametrize(
+        "query_string",
+        [
+            "category=crypto&limit=10",
+            "min_volume=10000&limit=10",
+            "max_time_hours=2.0&limit=10",
+        ],
+    )
+    async def test_filter_markets_with_param(
+        self, client, mock_scraper_service, sample_market, query_string
     ):
-        """Test filtering markets by category."""
-        mock_scraper_service.get_filtered_markets = AsyncMock(
-            return_value=([sample_market], {})
-        )
-        mock_scraper_service.apply_custom_filter = MagicMock(
-            return_value=[sample_market]
-        )
+        """Test filtering markets by each custom filter parameter."""
+        mock_scraper_service.get_filtered_markets.return_value = ([sample_market], {})
+        mock_scraper_service.apply_custom_filter.return_value = [sample_market]
 
-        response = client.post("/markets/filter?category=crypto&limit=10")
+        response = await client.post(f"/markets/filter?{query_string}")
 
         assert response.status_code == 200
         mock_scraper_service.apply_custom_filter.assert_called_once()
 
-    def test_filter_markets_with_min_volume(
-        self, client, mock_scraper_service, sample_market
-    ):
-        """Test filtering markets by minimum volume."""
-        mock_scraper_service.get_filtered_markets = AsyncMock(
-            return_value=([sample_market], {})
-        )
-        mock_scraper_service.apply_custom_filter = MagicMock(
-            return_value=[sample_market]
-        )
-
-        response = client.post("/markets/filter?min_volume=10000&limit=10")
-
-        assert response.status_code == 200
-
-    def test_filter_markets_with_max_time_hours(
-        self, client, mock_scraper_service, sample_market
-    ):
-        """Test filtering markets by max time to resolution."""
-        mock_scraper_service.get_filtered_markets = AsyncMock(
-            return_value=([sample_market], {})
-        )
-        mock_scraper_service.apply_custom_filter = MagicMock(
-            return_value=[sample_market]
-        )
-
-        response = client.post("/markets/filter?max_time_hours=2.0&limit=10")
-
-        assert response.status_code == 200
-
-    def test_filter_markets_error(self, client, mock_scraper_service):
-        """Test filter endpoint error handling."""
-        mock_scraper_service.get_filtered_markets = AsyncMock(
-            side_effect=Exception("Filter Error")
-        )
-
-        response = client.post("/markets/filter")
-
-        assert response.status_code == 500
-
 
 class TestSummaryEndpoints:
     """Tests for summary endpoints."""
 
-    def test_get_markets_summary(self, client, mock_scraper_service, sample_market):
+    async def test_get_markets_summary(self, client, mock_scraper_service, sample_market):
         """Test getting markets summary."""
-        mock_scraper_service.get_filtered_markets = AsyncMock(
-            return_value=([sample_market], {"total": 100, "filtered": 50})
-        )
+        mock_scraper_service.get_filtered_markets.return_value = ([sample_market], {"total": 100, "filtered": 50})
 
-        response = client.get("/markets/summary")
+        response = await client.get("/markets/summary")
 
         assert response.status_code == 200
         data = response.json()
@@ -278,11 +234,11 @@ class TestSummaryEndpoints:
         assert "average_liquidity" in data
         assert "categories" in data
 
-    def test_get_markets_summary_empty(self, client, mock_scraper_service):
+    async def test_get_markets_summary_empty(self, client, mock_scraper_service):
         """Test getting summary with no markets."""
-        mock_scraper_service.get_filtered_markets = AsyncMock(return_value=([], {}))
+        mock_scraper_service.get_filtered_markets.return_value = ([], {})
 
-        response = client.get("/markets/summary")
+        response = await client.get("/markets/summary")
 
         assert response.status_code == 200
         data = response.json()
@@ -290,23 +246,40 @@ class TestSummaryEndpoints:
         assert data["average_liquidity"] == 0
         assert data["categories"] == []
 
-    def test_get_markets_summary_error(self, client, mock_scraper_service):
-        """Test summary endpoint error handling."""
-        mock_scraper_service.get_filtered_markets = AsyncMock(
-            side_effect=Exception("Summary Error")
-        )
+class TestErrorHandling:
+    """Tests for endpoint error handling."""
+
+    @pytest.mark.parametrize(
+        ("method", "http_method", "url"),
+        [
+            ("get_filtered_markets", "GET", "/markets"),
+            ("get_tradeable_markets", "GET", "/markets/tradeable"),
+            ("get_market", "GET", "/markets/market-001"),
+            ("get_filtered_markets", "POST", "/markets/filter"),
+            ("get_filtered_markets", "GET", "/markets/summary"),
+        ],
+    )
+    async def test_endpoint_error(
+        self, client, mock_scraper_service, method, http_method, url
+    ):
+        """Test each endpoint returns 500 when its service call raises."""
+        getattr(mock_scraper_service, method).side_effect = Exception("Service Error")
 
-        response = client.get("/markets/summary")
+        if http_method == "GET":
+            response = await client.get(url)
+        else:
+            response = await client.post(url)
 
         assert response.status_code == 500
+        assert "Service Error" in response.json()["detail"]
 
 
 class TestConfigEndpoints:
     """Tests for configuration endpoints."""
 
-    def test_get_filter_config(self, client):
+    async def test_get_filter_config(self, client):
         """Test getting filter configuration."""
-        response = client.get("/filters/config")
+        response = await client.get("/filters/config")
 
         assert response.status_code == 200
         data = response.json()
@@ -2,6 +2,7 @@
 Unit tests for trader service.
 """
 
+from dataclasses import dataclass, field
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -16,130 +17,169 @@ from shared.models import (
 )
 
 
-@pytest.fixture
+@dataclass(frozen=True)
+class _TradingConfig:
+    """Plain settings stand-ins with direct attribute access."""
+
+    min_balance_to_trade: float = 10.0
+    max_bet_amount: float = 50.0
+    max_positions: int = 10
+
+
+@dataclass(frozen=True)
+class _FakeMoneyConfig:
+    initial_balance: float = 1000.0
+
+
+@dataclass(frozen=True)
+class _TraderSettings:
+    real_money_enabled: bool = False
+    fake_money_enabled: bool = True
+    trading: _TradingConfig = field(default_factory=_TradingConfig)
+    workflows_fake_money: _FakeMoneyConfig = field(default_factory=_FakeMoneyConfig)
+
+
+@pytest.fixture(scope="module")
 def mock_settings():
-    """Create mock settings."""
-    settings = MagicMock()
-    settings.real_money_enabled = False
-    settings.fake_money_enabled = True
-    settings.trading = MagicMock()
-    settings.trading.min_balance_to_trade = 10.0
-    settings.trading.max_bet_amount = 50.0
-    settings.trading.max_positions = 10
-    settings.workflows_fake_money = MagicMock()
-    settings.workflows_fake_money.initial_balance = 1000.0
-    return settings
-
-
-@pytest.fixture
+    """Create lightweight settings for trader tests."""
+    return _TraderSettings()
+
+
+class _FakeWallet:
+    """Minimal wallet stand-in without Mock bookkeeping."""
+
+    __slots__ = ("wallet_id", "balance", "_afford")
+
+    def __init__(self, balance: float = 1000.0, afford: bool = True):
+        self.wallet_id = "test-wallet"
+        self.balance = balance
+        self._afford = afford
+
+    def can_afford(self, amount: float) -> bool:
+        return self._afford
+
+    def deduct(self, amount: float) -> bool:
+        if not self._afford:
+            return False
+        self.balance -= amount
+        return True
+
+    def add(self, amount: float) -> None:
+        self.balance += amount
+
+
+def _restore_firestore_returns(client, wallet):
+    """Point every mocked Firestore method at its default return value."""
+    client.get_or_create_wallet.return_value = wallet
+    client.get_wallet.return_value = wallet
+    client.update_wallet_balance.return_value = wallet
+    client.delete_position.return_value = True
+    client.get_open_positions.return_value = []
+
+
+@pytest.fixture(scope="module")
 def mock_firestore():
-    """Create mock Firestore client."""
+    """Create mock Firestore client (shared across the module)."""
     client = MagicMock()
-
-    # Mock wallet
-    mock_wallet = MagicMock()
-    mock_wallet.wallet_id = "test-wallet"
-    mock_wallet.balance = 1000.0
-    mock_wallet.can_afford = MagicMock(return_value=True)
-    mock_wallet.deduct = MagicMock(return_value=True)
-    mock_wallet.add = MagicMock()
-
-    client.get_or_create_wallet = AsyncMock(return_value=mock_wallet)
-    client.get_wallet = AsyncMock(return_value=mock_wallet)
-    client.update_wallet_balance = AsyncMock(return_value=mock_wallet)
+    client.get_or_create_wallet = AsyncMock()
+    client.get_wallet = AsyncMock()
+    client.update_wallet_balance = AsyncMock()
     client.create_transaction = AsyncMock()
     client.create_position = AsyncMock()
-    client.delete_position = AsyncMock(return_value=True)
-    client.get_open_positions = AsyncMock(return_value=[])
-
+    client.delete_position = AsyncMock()
+    client.get_open_positions = AsyncMock()
+    _restore_firestore_returns(client, _FakeWallet())
     return client
 
 
-@pytest.fixture
-def sample_position():
-    """Create a sample position."""
-    return Position(
-        id="pos-001",
-        market_id="market-001",
-        outcome="Yes",
-        entry_price=0.35,
-        current_price=0.40,
-        quantity=100,
-        entry_value=35.0,
-        current_value=40.0,
-        mode=TradingMode.FAKE,
+@pytest.fixture(autouse=True)
+def _reset_firestore(mock_firestore):
+    """Restore default mock behavior so per-test overrides don't leak."""
+    for method in (
+        mock_firestore.get_or_create_wallet,
+        mock_firestore.get_wallet,
+        mock_firestore.update_wallet_balance,
+        mock_firestore.create_transaction,
+        mock_firestore.create_position,
+        mock_firestore.delete_position,
+        mock_firestore.get_open_positions,
+    ):
+        method.reset_mock(return_value=True, side_effect=True)
+    # Fresh wallet per test: _FakeWallet mutates its balance on deduct/add.
+    _restore_firestore_returns(mock_firestore, _FakeWallet())
+
+
+@pytest.fixture(scope="class")
+def trader_service(mock_settings, mock_firestore):
+    """Create a TraderService wired to the shared mocks."""
+    return TraderService(
+        firestore_client=mock_firestore,
+        settings=mock_settings,
     )
 
 
+# Sample models validated once at import; tests only read them.
+_SAMPLE_POSITION = Position(
+    id="pos-001",
+    market_id="market-001",
+    outcome="Yes",
+    entry_price=0.35,
+    current_price=0.40,
+    quantity=100,
+    entry_value=35.0,
+    current_value=40.0,
+    mode=TradingMode.FAKE,
+)
+_SAMPLE_SUGGESTION = AISuggestion(
+    market_id="market-001",
+    market_question="Test market",
+    recommended_outcome="Yes",
+    confidence=0.85,
+)
+
+
+@pytest.fixture(scope="module")
+def sample_position():
+    """Return the shared sample position."""
+    return _SAMPLE_POSITION
+
+
 class TestTraderService:
     """Tests for TraderService."""
 
-    @pytest.mark.asyncio
-    async def test_get_balance_fake(self, mock_settings, mock_firestore):
+    async def test_get_balance_fake(self, trader_service, mock_firestore):
         """Test getting fake balance."""
-        service = TraderService(
-            firestore_client=mock_firestore,
-            settings=mock_settings,
-        )
-
-        balance = await service.get_balance(TradingMode.FAKE)
+        balance = await trader_service.get_balance(TradingMode.FAKE)
 
         assert balance == 1000.0
         mock_firestore.get_or_create_wallet.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_can_trade_fake_enabled(self, mock_settings, mock_firestore):
+    async def test_can_trade_fake_enabled(self, trader_service):
         """Test can_trade when fake trading is enabled."""
-        service = TraderService(
-            firestore_client=mock_firestore,
-            settings=mock_settings,
-        )
-
-        can_trade, reason = await service.can_trade(TradingMode.FAKE, 50.0)
+        can_trade, reason = await trader_service.can_trade(TradingMode.FAKE, 50.0)
 
         assert can_trade is True
         assert reason == "OK"
 
-    @pytest.mark.asyncio
-    async def test_can_trade_real_disabled(self, mock_settings, mock_firestore):
+    async def test_can_trade_real_disabled(self, trader_service):
         """Test can_trade when real trading is disabled."""
-        service = TraderService(
-            firestore_client=mock_firestore,
-            settings=mock_settings,
-        )
-
-        can_trade, reason = await service.can_trade(TradingMode.REAL, 50.0)
+        can_trade, reason = await trader_service.can_trade(TradingMode.REAL, 50.0)
 
         assert can_trade is False
         assert "disabled" in reason
 
-    @pytest.mark.asyncio
-    async def test_can_trade_insufficient_balance(self, mock_settings, mock_firestore):
+    async def test_can_trade_insufficient_balance(self, trader_service, mock_firestore):
         """Test can_trade with insufficient balance."""
-        # Set low balance
-        mock_wallet = MagicMock()
-        mock_wallet.balance = 5.0
-        mock_firestore.get_or_create_wallet = AsyncMock(return_value=mock_wallet)
-
-        service = TraderService(
-            firestore_client=mock_firestore,
-            settings=mock_settings,
-        )
+        mock_firestore.get_or_create_wallet.return_value = _FakeWallet(balance=5.0)
 
-        can_trade, reason = await service.can_trade(TradingMode.FAKE, 50.0)
+        can_trade, reason = await trader_service.can_trade(TradingMode.FAKE, 50.0)
 
         assert can_trade is False
         assert "below minimum" in reason or "Insufficient" in reason
 
-    @pytest.mark.asyncio
-    async def test_place_buy_order_fake(self, mock_settings, mock_firestore):
+    async def test_place_buy_order_fake(self, trader_service, mock_firestore):
         """Test placing fake buy order."""
-        service = TraderService(
-            firestore_client=mock_firestore,
-            settings=mock_settings,
-        )
-
-        order = await service.place_buy_order(
+        order = await trader_service.place_buy_order(
             market_id="market-001",
             outcome="Yes",
             amount=50.0,
@@ -153,20 +193,11 @@ class TestTraderService:
         mock_firestore.create_position.assert_called_once()
         mock_firestore.create_transaction.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_place_buy_order_fake_insufficient_funds(self, mock_settings, mock_firestore):
+    async def test_place_buy_order_fake_insufficient_funds(self, trader_service, mock_firestore):
         """Test placing fake buy order with insufficient funds."""
-        mock_wallet = MagicMock()
-        mock_wallet.balance = 1000.0
-        mock_wallet.can_afford = MagicMock(return_value=False)
-        mock_firestore.get_or_create_wallet = AsyncMock(return_value=mock_wallet)
-
-        service = TraderService(
-            firestore_client=mock_firestore,
-            settings=mock_settings,
-        )
+        mock_firestore.get_or_create_wallet.return_value = _FakeWallet(afford=False)
 
-        order = await service.place_buy_order(
+        order = await trader_service.place_buy_order(
             market_id="market-001",
             outcome="Yes",
             amount=50.0,
@@ -177,38 +208,19 @@ class TestTraderService:
         assert order.status == OrderStatus.FAILED
         assert "Insufficient" in order.error_message
 
-    @pytest.mark.asyncio
-    async def test_place_sell_order_fake(self, mock_settings, mock_firestore, sample_position):
+    async def test_place_sell_order_fake(self, trader_service, mock_firestore, sample_position):
         """Test placing fake sell order."""
-        service = TraderService(
-            firestore_client=mock_firestore,
-            settings=mock_settings,
-        )
-
-        order = await service.place_sell_order(sample_position, price=0.40)
+        order = await trader_service.place_sell_order(sample_position, price=0.40)
 
         assert order.status == OrderStatus.FILLED
         assert order.side == OrderSide.SELL
         mock_firestore.delete_position.assert_called_once()
         mock_firestore.create_transaction.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_execute_suggestion(self, mock_settings, mock_firestore):
+    async def test_execute_suggestion(self, trader_service):
         """Test executing AI suggestion."""
-        suggestion = AISuggestion(
-            market_id="market-001",
-            market_question="Test market",
-            recommended_outcome="Yes",
-            confidence=0.85,
-        )
-
-        service = TraderService(
-            firestore_client=mock_firestore,
-            settings=mock_settings,
-        )
-
-        order = await service.execute_suggestion(
-            suggestion=suggestion,
+        order = await trader_service.execute_suggestion(
+            suggestion=_SAMPLE_SUGGESTION,
             position_size=50.0,
             mode=TradingMode.FAKE,
         )
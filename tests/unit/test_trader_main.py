@@ -3,11 +3,15 @@ Unit tests for Trader service FastAPI endpoints.
 """
 
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
 
+import services.trader.main as trader_main
+from services.trader.main import app
 from shared.models import (
     AISuggestion,
     Order,
@@ -18,128 +22,123 @@ from shared.models import (
     TradingMode,
 )
 
+# Run every test on the module-scoped loop shared with the client fixture
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+# Deterministic timestamp; avoids a clock read per fixture instantiation
+_FIXED_NOW = datetime(2025, 1, 1)
+
+# Default mock payloads, validated once at import instead of per test. Tests
+# never mutate these instances, so sharing them across tests is safe.
+_SAMPLE_ORDER = Order(
+    id="order-001",
+    market_id="market-001",
+    outcome="Yes",
+    side=OrderSide.BUY,
+    price=0.35,
+    quantity=100,
+    total_value=35.0,
+    status=OrderStatus.FILLED,
+    mode=TradingMode.FAKE,
+)
+_SAMPLE_POSITION = Position(
+    id="position-001",
+    market_id="market-001",
+    market_question="Will BTC reach $100k?",
+    outcome="Yes",
+    entry_price=0.30,
+    current_price=0.35,
+    quantity=100,
+    entry_value=30.0,
+    current_value=35.0,
+    pnl_percent=16.67,
+    created_at=_FIXED_NOW,
+    mode=TradingMode.FAKE,
+)
+_SELL_ORDER_FILLED = Order(
+    id="order-002",
+    market_id="market-001",
+    outcome="Yes",
+    side=OrderSide.SELL,
+    price=0.40,
+    quantity=100,
+    total_value=40.0,
+    status=OrderStatus.FILLED,
+    mode=TradingMode.FAKE,
+)
+_EXECUTED_ORDER = _SAMPLE_ORDER.model_copy(update={"id": "order-003"})
+_SAMPLE_SUGGESTION = AISuggestion(
+    market_id="market-001",
+    market_question="Will BTC reach $100k?",
+    recommended_outcome="Yes",
+    confidence=0.85,
+    reasoning="Strong momentum",
+    suggested_position_size=0.1,
+    risk_level=RiskLevel.MEDIUM,
+)
 
-@pytest.fixture
-def mock_trader_service():
-    """Create a mocked trader service."""
-    service = MagicMock()
-    service.get_balance = AsyncMock(return_value=1000.0)
-    service.can_trade = AsyncMock(return_value=(True, "Trading enabled"))
-    service.place_buy_order = AsyncMock(
-        return_value=Order(
-            id="order-001",
-            market_id="market-001",
-            outcome="Yes",
-            side=OrderSide.BUY,
-            price=0.35,
-            quantity=100,
-            total_value=35.0,
-            status=OrderStatus.FILLED,
-            mode=TradingMode.FAKE,
-        )
-    )
-    service.place_sell_order = AsyncMock(
-        return_value=Order(
-            id="order-002",
-            market_id="market-001",
-            outcome="Yes",
-            side=OrderSide.SELL,
-            price=0.40,
-            quantity=100,
-            total_value=40.0,
-            status=OrderStatus.FILLED,
-            mode=TradingMode.FAKE,
-        )
-    )
-    service.execute_suggestion = AsyncMock(
-        return_value=Order(
-            id="order-003",
-            market_id="market-001",
-            outcome="Yes",
-            side=OrderSide.BUY,
-            price=0.35,
-            quantity=100,
-            total_value=35.0,
-            status=OrderStatus.FILLED,
-            mode=TradingMode.FAKE,
-        )
-    )
-    return service
-
-
-@pytest.fixture
-def sample_order():
-    """Create a sample order."""
-    return Order(
-        id="order-001",
-        market_id="market-001",
-        outcome="Yes",
-        side=OrderSide.BUY,
-        price=0.35,
-        quantity=100,
-        total_value=35.0,
-        status=OrderStatus.FILLED,
-        mode=TradingMode.FAKE,
-    )
+# Serialized once for request payloads
+_SAMPLE_POSITION_JSON = _SAMPLE_POSITION.model_dump(mode="json")
+_SAMPLE_SUGGESTION_JSON = _SAMPLE_SUGGESTION.model_dump()
 
 
-@pytest.fixture
-def sample_position():
-    """Create a sample position."""
-    return Position(
-        id="position-001",
-        market_id="market-001",
-        market_question="Will BTC reach $100k?",
-        outcome="Yes",
-        entry_price=0.30,
-        current_price=0.35,
-        quantity=100,
-        entry_value=30.0,
-        current_value=35.0,
-        pnl_percent=16.67,
-        created_at=datetime.utcnow(),
-        mode=TradingMode.FAKE,
-    )
+def _restore_default_returns(service):
+    """Point every mocked service method at its default return value."""
+    service.get_balance.return_value = 1000.0
+    service.can_trade.return_value = (True, "Trading enabled")
+    service.place_buy_order.return_value = _SAMPLE_ORDER
+    service.place_sell_order.return_value = _SELL_ORDER_FILLED
+    service.execute_suggestion.return_value = _EXECUTED_ORDER
 
 
-@pytest.fixture
-def sample_suggestion():
-    """Create a sample AI suggestion."""
-    return AISuggestion(
-        market_id="market-001",
-        market_question="Will BTC reach $100k?",
-        recommended_outcome="Yes",
-        confidence=0.85,
-        reasoning="Strong momentum",
-        suggested_position_size=0.1,
-        risk_level=RiskLevel.MEDIUM,
+@pytest.fixture(scope="module")
+def mock_trader_service():
+    """Create a mocked trader service (shared across the module).
+
+    A plain namespace of AsyncMocks: the endpoints only touch these five
+    methods, so there is no need for MagicMock's attribute auto-creation.
+    """
+    service = SimpleNamespace(
+        get_balance=AsyncMock(),
+        can_trade=AsyncMock(),
+        place_buy_order=AsyncMock(),
+        place_sell_order=AsyncMock(),
+        execute_suggestion=AsyncMock(),
     )
+    _restore_default_returns(service)
+    return service
 
 
-@pytest.fixture
-def client(mock_trader_service):
-    """Create test client with mocked service."""
-    with patch("services.trader.main._trader_service", None):
-        with patch(
-            "services.trader.main.get_trader_service",
-            return_value=mock_trader_service,
-        ):
-            import services.trader.main as trader_main
-            from services.trader.main import app
+@pytest.fixture(autouse=True)
+def _reset_trader_service(mock_trader_service):
+    """Restore default mock behavior so per-test overrides don't leak."""
+    for method in (
+        mock_trader_service.get_balance,
+        mock_trader_service.can_trade,
+        mock_trader_service.place_buy_order,
+        mock_trader_service.place_sell_order,
+        mock_trader_service.execute_suggestion,
+    ):
+        method.reset_mock(return_value=True, side_effect=True)
+    _restore_default_returns(mock_trader_service)
 
-            # Reset service instance
-            trader_main._trader_service = None
 
-            with TestClient(app) as test_client:
-                yield test_client
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def client(mock_trader_service):
+    """Create an in-process async client with the mocked service installed."""
+    app.dependency_overrides[trader_main.get_service] = lambda: mock_trader_service
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as async_client:
+        yield async_client
+    app.dependency_overrides.pop(trader_main.get_service, None)
 
 
 class TestHealthEndpoints:
     """Tests for health check endpoints."""
 
-    def test_health_check(self, client):
+    async def test_health_check(self, client):
         """Test health check endpoint returns healthy status."""
-        response = client.get("/health")
+        response = await client.get("/health")
 
         assert response.status_code == 200
         data = response.json()
@@ -150,97 +149,56 @@ class TestHealthEndpoints:
 class TestBalanceEndpoints:
     """Tests for balance endpoints."""
 
-    def test_get_balance_fake(self, client, mock_trader_service):
-        """Test getting fake mode balance."""
-        mock_trader_service.get_balance = AsyncMock(return_value=1000.0)
-
-        response = client.get("/balance/fake")
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["mode"] == "fake"
-        assert data["balance"] == 1000.0
-        assert data["available_for_trading"] is True
-
-    def test_get_balance_real(self, client, mock_trader_service):
-        """Test getting real mode balance."""
-        mock_trader_service.get_balance = AsyncMock(return_value=500.0)
-
-        response = client.get("/balance/real")
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["mode"] == "real"
-        assert data["balance"] == 500.0
-
-    def test_get_balance_low(self, client, mock_trader_service):
-        """Test getting balance below trading threshold."""
-        mock_trader_service.get_balance = AsyncMock(return_value=5.0)
+    @pytest.mark.parametrize(
+        ("mode", "balance", "available"),
+        [
+            ("fake", 1000.0, True),
+            ("real", 500.0, True),
+            ("fake", 5.0, False),  # below the trading threshold
+        ],
+    )
+    async def test_get_balance(self, client, mock_trader_service, mode, balance, available):
+        """Test balance reporting across modes and trading thresholds."""
+        mock_trader_service.get_balance.return_value = balance
 
-        response = client.get("/balance/fake")
+        response = await client.get(f"/balance/{mode}")
 
         assert response.status_code == 200
         data = response.json()
-        assert data["balance"] == 5.0
-        assert data["available_for_trading"] is False
-
-    def test_get_balance_error(self, client, mock_trader_service):
-        """Test balance error handling."""
-        mock_trader_service.get_balance = AsyncMock(
-            side_effect=Exception("Balance Error")
-        )
-
-        response = client.get("/balance/fake")
-
-        assert response.status_code == 500
-
-    def test_can_trade_yes(self, client, mock_trader_service):
-        """Test can trade check when trading is possible."""
-        mock_trader_service.can_trade = AsyncMock(
-            return_value=(True, "Trading enabled")
-        )
+        assert data["mode"] == mode
+        assert data["balance"] == balance
+        assert data["available_for_trading"] is available
+
+    @pytest.mark.parametrize(
+        ("amount", "can_trade", "reason"),
+        [
+            (50.0, True, "Trading enabled"),
+            (5000.0, False, "Insufficient balance"),
+        ],
+    )
+    async def test_can_trade(self, client, mock_trader_service, amount, can_trade, reason):
+        """Test can-trade check for both outcomes."""
+        mock_trader_service.can_trade.return_value = (can_trade, reason)
 
-        response = client.get("/can-trade?mode=fake&amount=50")
+        response = await client.get(f"/can-trade?mode=fake&amount={amount}")
 
         assert response.status_code == 200
         data = response.json()
-        assert data["can_trade"] is True
+        assert data["can_trade"] is can_trade
         assert data["mode"] == "fake"
-        assert data["amount"] == 50.0
-
-    def test_can_trade_no(self, client, mock_trader_service):
-        """Test can trade check when trading is not possible."""
-        mock_trader_service.can_trade = AsyncMock(
-            return_value=(False, "Insufficient balance")
-        )
-
-        response = client.get("/can-trade?mode=fake&amount=5000")
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["can_trade"] is False
-        assert "Insufficient balance" in data["reason"]
-
-    def test_can_trade_error(self, client, mock_trader_service):
-        """Test can trade error handling."""
-        mock_trader_service.can_trade = AsyncMock(
-            side_effect=Exception("Trade Check Error")
-        )
-
-        response = client.get("/can-trade?mode=fake&amount=50")
-
-        assert response.status_code == 500
+        assert data["amount"] == amount
+        assert reason in data["reason"]
 
 
 class TestOrderEndpoints:
     """Tests for order endpoints."""
 
-    def test_place_buy_order_success(self, client, mock_trader_service, sample_order):
+    async def test_place_buy_order_success(self, client, mock_trader_service):
         """Test placing a successful buy order."""
-        mock_trader_service.can_trade = AsyncMock(return_value=(True, "OK"))
-        mock_trader_service.place_buy_order = AsyncMock(return_value=sample_order)
+        mock_trader_service.can_trade.return_value = (True, "OK")
+        mock_trader_service.place_buy_order.return_value = _SAMPLE_ORDER
 
-        response = client.post(
+        response = await client.post(
             "/orders/buy",
             json={
                 "market_id": "market-001",
@@ -257,13 +215,11 @@ class TestOrderEndpoints:
         assert data["side"] == "buy"
         assert data["status"] == "filled"
 
-    def test_place_buy_order_cannot_trade(self, client, mock_trader_service):
+    async def test_place_buy_order_cannot_trade(self, client, mock_trader_service):
         """Test buy order when trading is not possible."""
-        mock_trader_service.can_trade = AsyncMock(
-            return_value=(False, "Insufficient balance")
-        )
+        mock_trader_service.can_trade.return_value = (False, "Insufficient balance")
 
-        response = client.post(
+        response = await client.post(
             "/orders/buy",
             json={
                 "market_id": "market-001",
@@ -277,47 +233,16 @@ class TestOrderEndpoints:
         assert response.status_code == 400
         assert "Insufficient balance" in response.json()["detail"]
 
-    def test_place_buy_order_error(self, client, mock_trader_service):
-        """Test buy order error handling."""
-        mock_trader_service.can_trade = AsyncMock(return_value=(True, "OK"))
-        mock_trader_service.place_buy_order = AsyncMock(
-            side_effect=Exception("Order Error")
-        )
-
-        response = client.post(
-            "/orders/buy",
-            json={
-                "market_id": "market-001",
-                "outcome": "Yes",
-                "amount": 50.0,
-                "price": 0.35,
-                "mode": "fake",
-            },
-        )
-
-        assert response.status_code == 500
-
-    def test_place_sell_order_success(
-        self, client, mock_trader_service, sample_position
+    async def test_place_sell_order_success(
+        self, client, mock_trader_service
     ):
         """Test placing a successful sell order."""
-        sell_order = Order(
-            id="order-002",
-            market_id="market-001",
-            outcome="Yes",
-            side=OrderSide.SELL,
-            price=0.40,
-            quantity=100,
-            total_value=40.0,
-            status=OrderStatus.FILLED,
-            mode=TradingMode.FAKE,
-        )
-        mock_trader_service.place_sell_order = AsyncMock(return_value=sell_order)
+        mock_trader_service.place_sell_order.return_value = _SELL_ORDER_FILLED
 
-        response = client.post(
+        response = await client.post(
             "/orders/sell",
             json={
-                "position": sample_position.model_dump(mode="json"),
+                "position": _SAMPLE_POSITION_JSON,
                 "price": 0.40,
             },
         )
@@ -327,64 +252,36 @@ class TestOrderEndpoints:
         assert data["side"] == "sell"
         assert data["status"] == "filled"
 
-    def test_place_sell_order_no_price(
-        self, client, mock_trader_service, sample_position
+    async def test_place_sell_order_no_price(
+        self, client, mock_trader_service
     ):
         """Test selling with no limit price (market order)."""
-        sell_order = Order(
-            id="order-002",
-            market_id="market-001",
-            outcome="Yes",
-            side=OrderSide.SELL,
-            price=0.35,
-            quantity=100,
-            total_value=35.0,
-            status=OrderStatus.FILLED,
-            mode=TradingMode.FAKE,
-        )
-        mock_trader_service.place_sell_order = AsyncMock(return_value=sell_order)
+        mock_trader_service.place_sell_order.return_value = _SELL_ORDER_FILLED
 
-        response = client.post(
+        response = await client.post(
             "/orders/sell",
             json={
-                "position": sample_position.model_dump(mode="json"),
+                "position": _SAMPLE_POSITION_JSON,
             },
         )
 
         assert response.status_code == 200
 
-    def test_place_sell_order_error(
-        self, client, mock_trader_service, sample_position
-    ):
-        """Test sell order error handling."""
-        mock_trader_service.place_sell_order = AsyncMock(
-            side_effect=Exception("Sell Error")
-        )
-
-        response = client.post(
-            "/orders/sell",
-            json={
-                "position": sample_position.model_dump(mode="json"),
-            },
-        )
-
-        assert response.status_code == 500
-
 
 class TestSuggestionEndpoints:
     """Tests for suggestion execution endpoints."""
 
-    def test_execute_suggestion_success(
-        self, client, mock_trader_service, sample_suggestion, sample_order
+    async def test_execute_suggestion_success(
+        self, client, mock_trader_service
     ):
         """Test executing AI suggestion successfully."""
-        mock_trader_service.can_trade = AsyncMock(return_value=(True, "OK"))
-        mock_trader_service.execute_suggestion = AsyncMock(return_value=sample_order)
+        mock_trader_service.can_trade.return_value = (True, "OK")
+        mock_trader_service.execute_suggestion.return_value = _SAMPLE_ORDER
 
-        response = client.post(
+        response = await client.post(
             "/orders/execute-suggestion",
             json={
-                "suggestion": sample_suggestion.model_dump(),
+                "suggestion": _SAMPLE_SUGGESTION_JSON,
                 "position_size": 50.0,
                 "mode": "fake",
             },
@@ -394,18 +291,16 @@ class TestSuggestionEndpoints:
         data = response.json()
         assert data["id"] == "order-001"
 
-    def test_execute_suggestion_cannot_trade(
-        self, client, mock_trader_service, sample_suggestion
+    async def test_execute_suggestion_cannot_trade(
+        self, client, mock_trader_service
     ):
         """Test suggestion execution when trading is not possible."""
-        mock_trader_service.can_trade = AsyncMock(
-            return_value=(False, "Trading disabled")
-        )
+        mock_trader_service.can_trade.return_value = (False, "Trading disabled")
 
-        response = client.post(
+        response = await client.post(
             "/orders/execute-suggestion",
             json={
-                "suggestion": sample_suggestion.model_dump(),
+                "suggestion": _SAMPLE_SUGGESTION_JSON,
                 "position_size": 50.0,
                 "mode": "fake",
             },
@@ -413,33 +308,13 @@ class TestSuggestionEndpoints:
 
         assert response.status_code == 400
 
-    def test_execute_suggestion_error(
-        self, client, mock_trader_service, sample_suggestion
-    ):
-        """Test suggestion execution error handling."""
-        mock_trader_service.can_trade = AsyncMock(return_value=(True, "OK"))
-        mock_trader_service.execute_suggestion = AsyncMock(
-            side_effect=Exception("Execution Error")
-        )
-
-        response = client.post(
-            "/orders/execute-suggestion",
-            json={
-                "suggestion": sample_suggestion.model_dump(),
-                "position_size": 50.0,
-                "mode": "fake",
-            },
-        )
-
-        assert response.status_code == 500
-
 
 class TestConfigEndpoints:
     """Tests for configuration endpoints."""
 
-    def test_get_trading_config(self, client):
+    async def test_get_trading_config(self, client):
         """Test getting trading configuration."""
-        response = client.get("/config")
+        response = await client.get("/config")
 
         assert response.status_code == 200
         data = response.json()
@@ -448,3 +323,56 @@ class TestConfigEndpoints:
         assert "max_positions" in data
         assert "real_money_enabled" in data
         assert "fake_money_enabled" in data
+
+
+class TestErrorHandling:
+    """Tests for endpoint error handling."""
+
+    @pytest.mark.parametrize(
+        ("method", "http_method", "url", "json_body"),
+        [
+            ("get_balance", "GET", "/balance/fake", None),
+            ("can_trade", "GET", "/can-trade?mode=fake&amount=50", None),
+            (
+                "place_buy_order",
+                "POST",
+                "/orders/buy",
+                {
+                    "market_id": "market-001",
+                    "outcome": "Yes",
+                    "amount": 50.0,
+                    "price": 0.35,
+                    "mode": "fake",
+                },
+            ),
+            (
+                "place_sell_order",
+                "POST",
+                "/orders/sell",
+                {"position": _SAMPLE_POSITION_JSON},
+            ),
+            (
+                "execute_suggestion",
+                "POST",
+                "/orders/execute-suggestion",
+                {
+                    "suggestion": _SAMPLE_SUGGESTION_JSON,
+                    "position_size": 50.0,
+                    "mode": "fake",
+                },
+            ),
+        ],
+    )
+    async def test_endpoint_error(
+        self, client, mock_trader_service, method, http_method, url, json_body
+    ):
+        """Test each endpoint returns 500 when its service call raises."""
+        getattr(mock_trader_service, method).side_effect = Exception("Service Error")
+
+        if http_method == "GET":
+            response = await client.get(url)
+        else:
+            response = await client.post(url, json=json_body)
+
+        assert response.status_code == 500
+        assert "Service Error" in response.json()["detail"]